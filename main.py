@@ -1,298 +1,700 @@
 import os
+import sys
+import json
+import queue
 import asyncio
+import logging
+import contextlib
+import contextvars
+import itertools
+import functools
+import hashlib
+import uuid
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Literal, Optional, Tuple
 from dotenv import load_dotenv
+from pydantic import BaseModel
 from elevenlabs_mcp import ElevenLabsMCPServer
 from elevenlabs_mcp.types import Tool, TextContent
 
-# Load environment variables
+# Load environment variables before importing the tools, which read their
+# settings at import time; this is the only .env parse the server does
 load_dotenv()
 
+from tools.youtube_tool import get_audio_from_youtube
+from tools.transcription_tool import transcribe_audio, warm_up_whisper
+from tools import llm_cache
+from tools.llm_tool import MODEL_NAME, find_key_moments, generate_short_script, generate_comprehensive_script, detect_speaker_gender
+from tools.voice_tool import (
+    DEFAULT_ELEVENLABS_MODEL, ELEVENLABS_MODELS, create_voiceover, create_voiceover_with_elevenlabs,
+    warm_up_tts, prewarm_elevenlabs_connection
+)
+from tools.tts_batcher import TTSBatcher
+from tools.single_flight import SingleFlight
+from tools.video_tool import create_sample_loop_video_from_script, create_looped_video_with_audio
+
+# Log through a queue so formatting and stderr writes happen on the listener
+# thread, never on the event loop; stdout is reserved for the MCP protocol
+logger = logging.getLogger("viral-pipeline")
+logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+_log_queue: queue.Queue = queue.Queue(-1)
+logger.addHandler(QueueHandler(_log_queue))
+logger.propagate = False
+_log_handler = logging.StreamHandler(sys.stderr)
+_log_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+_log_listener = QueueListener(_log_queue, _log_handler)
+
+# Read configuration once at startup and hand it to the tools explicitly
+ELEVENLABS_API_KEY = os.getenv("ELEVENLABS_API_KEY")
+WHISPER_MODEL = os.getenv("WHISPER_MODEL", "base")
+PRELOAD_MODELS = os.getenv("PRELOAD_MODELS", "1").lower() not in ("0", "false", "no")
+if not ELEVENLABS_API_KEY:
+    logger.warning("ELEVENLABS_API_KEY is not set; ElevenLabs voiceover tools will fail")
+if not os.getenv("GOOGLE_API_KEY"):
+    logger.warning("GOOGLE_API_KEY is not set; Gemini-backed tools will fail")
+
 # Initialize the MCP server
 server = ElevenLabsMCPServer("viral-moment-pipeline")
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """
-    List all available tools for the viral moment content pipeline
-    """
-    return [
-        Tool(
-            name="create_looped_video_from_script",
-            description="Generate ElevenLabs audio from script and loop Sample_Video.mp4 to match duration",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "script": {"type": "string", "description": "Script text to narrate"},
-                    "background_video": {"type": "string", "description": "Optional background video path (defaults to Sample_Video.mp4)"}
-                },
-                "required": ["script"]
-            }
-        ),
-        Tool(
-            name="create_looped_video_from_audio",
-            description="Loop a background video to a given audio file and replace its audio",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "audio_path": {"type": "string", "description": "Path to narration audio (wav/mp3)"},
-                    "background_video": {"type": "string", "description": "Optional background video path (defaults to Sample_Video.mp4)"}
-                },
-                "required": ["audio_path"]
-            }
-        ),
-        Tool(
-            name="download_youtube_audio",
-            description="Download audio from a YouTube video URL",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "url": {
-                        "type": "string",
-                        "description": "YouTube video URL to download audio from"
-                    }
-                },
-                "required": ["url"]
-            }
-        ),
-        Tool(
-            name="transcribe_audio",
-            description="Transcribe audio file to text using local Whisper model",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "audio_path": {
-                        "type": "string",
-                        "description": "Path to the audio file to transcribe"
-                    }
-                },
-                "required": ["audio_path"]
-            }
-        ),
-        Tool(
-            name="find_viral_moments",
-            description="Analyze transcript to find the most viral-worthy moments",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "transcript": {
-                        "type": "string",
-                        "description": "Full transcript text to analyze"
-                    }
+# Schema fragments shared by several tools; every Tool references the same
+# dict objects rather than carrying its own copy
+_BACKGROUND_VIDEO_PROP = {"type": "string", "description": "Optional background video path (defaults to Sample_Video.mp4)"}
+_SCRIPT_TEXT_PROP = {"type": "string", "description": "Script text to convert to voiceover"}
+_BACKGROUND_JOB_PROP = {
+    "type": "boolean",
+    "description": "Return a job ID immediately and run in the background (poll with get_job_status/get_job_result)"
+}
+_JOB_ID_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "job_id": {"type": "string", "description": "Job ID returned by a tool started with background=true"}
+    },
+    "required": ["job_id"]
+}
+_VOICEOVER_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "script_text": _SCRIPT_TEXT_PROP,
+        "speaker_gender": {
+            "type": "string",
+            "description": "Speaker gender (male/female/unknown) for voice selection"
+        }
+    },
+    "required": ["script_text"]
+}
+_ELEVENLABS_VOICEOVER_SCHEMA = {
+    **_VOICEOVER_SCHEMA,
+    "properties": {
+        **_VOICEOVER_SCHEMA["properties"],
+        "model_id": {
+            "type": "string",
+            "enum": list(ELEVENLABS_MODELS),
+            "description": f"ElevenLabs model (defaults to {DEFAULT_ELEVENLABS_MODEL}, the lowest-latency option)"
+        }
+    }
+}
+
+# The tool list is static, so build the Tool objects once at import
+_TOOLS: list[Tool] = [
+    Tool(
+        name="create_looped_video_from_script",
+        description="Generate ElevenLabs audio from script and loop Sample_Video.mp4 to match duration",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "script": {"type": "string", "description": "Script text to narrate"},
+                "background_video": _BACKGROUND_VIDEO_PROP,
+                "background": _BACKGROUND_JOB_PROP
+            },
+            "required": ["script"]
+        }
+    ),
+    Tool(
+        name="create_looped_video_from_audio",
+        description="Loop a background video to a given audio file and replace its audio",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "audio_path": {"type": "string", "description": "Path to narration audio (wav/mp3)"},
+                "background_video": _BACKGROUND_VIDEO_PROP,
+                "background": _BACKGROUND_JOB_PROP
+            },
+            "required": ["audio_path"]
+        }
+    ),
+    Tool(
+        name="download_youtube_audio",
+        description="Download audio from a YouTube video URL",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "url": {
+                    "type": "string",
+                    "description": "YouTube video URL to download audio from"
+                }
+            },
+            "required": ["url"]
+        }
+    ),
+    Tool(
+        name="transcribe_audio",
+        description="Transcribe audio file to text using local Whisper model",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "audio_path": {
+                    "type": "string",
+                    "description": "Path to the audio file to transcribe"
                 },
-                "required": ["transcript"]
-            }
-        ),
-        Tool(
-            name="generate_short_script",
-            description="Generate a dynamic-length video script from viral moments (covers all viral moments)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "moment_summary": {
-                        "type": "string",
-                        "description": "Summary of viral moments to create script from (can be single or multiple)"
-                    }
+                "background": _BACKGROUND_JOB_PROP
+            },
+            "required": ["audio_path"]
+        }
+    ),
+    Tool(
+        name="youtube_to_viral_moments",
+        description="Download a YouTube video's audio, transcribe it and find its viral moments in one call",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "url": {
+                    "type": "string",
+                    "description": "YouTube video URL to analyze"
                 },
-                "required": ["moment_summary"]
-            }
-        ),
-        Tool(
-            name="generate_comprehensive_script",
-            description="Generate a comprehensive script from multiple viral moments with full details",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "viral_moments": {
-                        "type": "array",
-                        "description": "Array of viral moment objects with all details",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "summary": {"type": "string"},
-                                "quote": {"type": "string"},
-                                "viral_factor": {"type": "string"},
-                                "priority": {"type": "string"},
-                                "hook": {"type": "string"},
-                                "timestamp": {"type": "string"}
-                            }
+                "background": _BACKGROUND_JOB_PROP
+            },
+            "required": ["url"]
+        }
+    ),
+    Tool(
+        name="find_viral_moments",
+        description="Analyze transcript to find the most viral-worthy moments",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "transcript": {
+                    "type": "string",
+                    "description": "Full transcript text to analyze"
+                }
+            },
+            "required": ["transcript"]
+        }
+    ),
+    Tool(
+        name="generate_short_script",
+        description="Generate a dynamic-length video script from viral moments (covers all viral moments)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "moment_summary": {
+                    "type": "string",
+                    "description": "Summary of viral moments to create script from (can be single or multiple)"
+                }
+            },
+            "required": ["moment_summary"]
+        }
+    ),
+    Tool(
+        name="generate_comprehensive_script",
+        description="Generate a comprehensive script from multiple viral moments with full details",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "viral_moments": {
+                    "type": "array",
+                    "description": "Array of viral moment objects with all details",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "summary": {"type": "string"},
+                            "quote": {"type": "string"},
+                            "viral_factor": {"type": "string"},
+                            "priority": {"type": "string"},
+                            "hook": {"type": "string"},
+                            "timestamp": {"type": "string"}
                         }
                     }
+                }
+            },
+            "required": ["viral_moments"]
+        }
+    ),
+    Tool(
+        name="create_voiceover",
+        description="Generate voiceover audio from script text using local TTS",
+        inputSchema=_VOICEOVER_SCHEMA
+    ),
+    Tool(
+        name="create_voiceover_with_elevenlabs",
+        description="Generate high-quality voiceover using ElevenLabs TTS with gender-appropriate voice",
+        inputSchema=_ELEVENLABS_VOICEOVER_SCHEMA
+    ),
+    Tool(
+        name="create_voiceover_with_auto_gender",
+        description="Generate voiceover with automatic gender detection from transcript",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "script_text": _SCRIPT_TEXT_PROP,
+                "transcript": {
+                    "type": "string",
+                    "description": "Original transcript for gender detection"
                 },
-                "required": ["viral_moments"]
-            }
-        ),
-        Tool(
-            name="create_voiceover",
-            description="Generate voiceover audio from script text using local TTS",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "script_text": {
-                        "type": "string",
-                        "description": "Script text to convert to voiceover"
-                    },
-                    "speaker_gender": {
-                        "type": "string",
-                        "description": "Speaker gender (male/female/unknown) for voice selection"
-                    }
-                },
-                "required": ["script_text"]
-            }
-        ),
-        Tool(
-            name="create_voiceover_with_elevenlabs",
-            description="Generate high-quality voiceover using ElevenLabs TTS with gender-appropriate voice",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "script_text": {
-                        "type": "string",
-                        "description": "Script text to convert to voiceover"
-                    },
-                    "speaker_gender": {
-                        "type": "string",
-                        "description": "Speaker gender (male/female/unknown) for voice selection"
-                    }
-                },
-                "required": ["script_text"]
-            }
-        ),
-        Tool(
-            name="create_voiceover_with_auto_gender",
-            description="Generate voiceover with automatic gender detection from transcript",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "script_text": {
-                        "type": "string",
-                        "description": "Script text to convert to voiceover"
-                    },
-                    "transcript": {
-                        "type": "string",
-                        "description": "Original transcript for gender detection"
-                    },
-                    "use_elevenlabs": {
-                        "type": "boolean",
-                        "description": "Whether to use ElevenLabs (true) or local TTS (false)"
-                    }
-                },
-                "required": ["script_text", "transcript"]
-            }
-        ),
-        
-    ]
+                "use_elevenlabs": {
+                    "type": "boolean",
+                    "description": "Whether to use ElevenLabs (true) or local TTS (false)"
+                }
+            },
+            "required": ["script_text", "transcript"]
+        }
+    ),
+    Tool(
+        name="get_job_status",
+        description="Check whether a background job is running, done or failed",
+        inputSchema=_JOB_ID_SCHEMA
+    ),
+    Tool(
+        name="get_job_result",
+        description="Get the result of a finished background job",
+        inputSchema=_JOB_ID_SCHEMA
+    )
+]
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """
+    List all available tools for the viral moment content pipeline
+    """
+    return _TOOLS
+
+# Progress sink for the tool call running on the current worker thread; unset
+# when the client didn't ask for progress
+_progress_reporter: contextvars.ContextVar[Optional[Callable[[str], None]]] = contextvars.ContextVar(
+    "progress_reporter", default=None
+)
+
+def _report_progress(message: str) -> None:
+    reporter = _progress_reporter.get()
+    if reporter is not None:
+        reporter(message)
+
+def _progress_token():
+    # Clients opt in to progress by sending a progressToken with the request
+    try:
+        meta = server.request_context.meta
+    except (AttributeError, LookupError):
+        return None
+    return getattr(meta, "progressToken", None) if meta else None
+
+async def _send_progress(progress_token, progress: int, message: str) -> None:
+    try:
+        await server.request_context.session.send_progress_notification(
+            progress_token=progress_token, progress=progress, message=message
+        )
+    except Exception:
+        # Progress is best effort; never fail a tool call over it
+        pass
+
+def _make_progress_reporter(progress_token, loop: asyncio.AbstractEventLoop) -> Callable[[str], None]:
+    steps = itertools.count(1)
+
+    def report(message: str) -> None:
+        # Called from the worker thread; hand the notification to the event loop
+        asyncio.run_coroutine_threadsafe(_send_progress(progress_token, next(steps), message), loop)
+
+    return report
+
+# Typed tool arguments, validated once at dispatch so handlers read
+# attributes and bad input is rejected before any expensive work starts
+class DownloadYoutubeAudioArgs(BaseModel):
+    url: str
+
+class BackgroundJobArgs(BaseModel):
+    # Long-running tools can be started as a job instead of blocking the call
+    background: bool = False
+
+class JobArgs(BaseModel):
+    job_id: str
+
+class TranscribeAudioArgs(BackgroundJobArgs):
+    audio_path: str
+
+class YoutubeToViralMomentsArgs(BackgroundJobArgs):
+    url: str
+
+class FindViralMomentsArgs(BaseModel):
+    transcript: str
+
+class GenerateShortScriptArgs(BaseModel):
+    moment_summary: str
+
+class GenerateComprehensiveScriptArgs(BaseModel):
+    viral_moments: list[dict[str, Any]]
+
+class VoiceoverArgs(BaseModel):
+    script_text: str
+    speaker_gender: str = "unknown"
+
+class ElevenLabsVoiceoverArgs(VoiceoverArgs):
+    model_id: Literal[ELEVENLABS_MODELS] = DEFAULT_ELEVENLABS_MODEL
+
+class AutoGenderVoiceoverArgs(BaseModel):
+    script_text: str
+    transcript: str
+    use_elevenlabs: bool = True
+
+class LoopedVideoFromScriptArgs(BackgroundJobArgs):
+    script: str
+    background_video: str = "Sample_Video.mp4"
+
+class LoopedVideoFromAudioArgs(BackgroundJobArgs):
+    audio_path: str
+    background_video: str = "Sample_Video.mp4"
+
+def _handle_download_youtube_audio(args: DownloadYoutubeAudioArgs) -> dict[str, Any]:
+    audio_path = get_audio_from_youtube(args.url)
+    return {"path": audio_path}
+
+# Concurrent requests for the same file share one Whisper run; faster-whisper
+# batches within a file, not across files, so this is the cross-request win
+_transcriptions = SingleFlight()
+
+def _transcribe_once(audio_path: str) -> str:
+    key = (os.path.realpath(audio_path), WHISPER_MODEL)
+    return _transcriptions.run(key, transcribe_audio, audio_path, model_size=WHISPER_MODEL)
+
+def _handle_transcribe_audio(args: TranscribeAudioArgs) -> dict[str, Any]:
+    _report_progress(f"transcribing {args.audio_path}")
+    transcript = _transcribe_once(args.audio_path)
+    return {"transcript": transcript}
+
+def _cached_llm_call(tool_name: str, payload, compute: Callable[[], object]):
+    # Identical inputs to the same model give the same answer; skip Gemini on a hit
+    key = llm_cache.make_key(tool_name, MODEL_NAME, payload)
+    result = llm_cache.get(key)
+    if result is None:
+        result = compute()
+        llm_cache.put(key, result)
+    return result
+
+def _handle_find_viral_moments(args: FindViralMomentsArgs) -> dict[str, Any]:
+    transcript = args.transcript
+    moments = _cached_llm_call("find_viral_moments", transcript, lambda: find_key_moments(transcript))
+    return {"moments": moments}
+
+async def _handle_youtube_to_viral_moments(args: YoutubeToViralMomentsArgs) -> dict[str, Any]:
+    # Chains the three stages server-side, so the transcript never round-trips
+    # through the client; each stage takes its own resource slot only while
+    # it runs, and the download/transcript/LLM caches make repeats cheap
+    async with _NET_SEM:
+        audio_path = await asyncio.to_thread(get_audio_from_youtube, args.url)
+    _report_progress(f"downloaded audio: {audio_path}")
+    
+    async with _GPU_SEM:
+        transcript = await asyncio.to_thread(_transcribe_once, audio_path)
+    _report_progress(f"transcribed {len(transcript)} characters")
+    
+    moments = await asyncio.to_thread(
+        _cached_llm_call, "find_viral_moments", transcript, lambda: find_key_moments(transcript)
+    )
+    return {"audio_path": audio_path, "transcript": transcript, "moments": moments}
+
+def _handle_generate_short_script(args: GenerateShortScriptArgs) -> dict[str, Any]:
+    moment_summary = args.moment_summary
+    script = _cached_llm_call("generate_short_script", moment_summary, lambda: generate_short_script(moment_summary))
+    return {"script": script}
+
+def _handle_generate_comprehensive_script(args: GenerateComprehensiveScriptArgs) -> dict[str, Any]:
+    viral_moments = args.viral_moments
+    script = _cached_llm_call(
+        "generate_comprehensive_script", viral_moments, lambda: generate_comprehensive_script(viral_moments)
+    )
+    return {"script": script}
+
+# Concurrent requests for the same script and voice share one synthesis
+_local_tts = TTSBatcher(create_voiceover)
+_elevenlabs_tts = TTSBatcher(functools.partial(create_voiceover_with_elevenlabs, api_key=ELEVENLABS_API_KEY))
+
+def _handle_create_voiceover(args: VoiceoverArgs) -> dict[str, Any]:
+    voiceover_path = _local_tts.submit(args.script_text, args.speaker_gender)
+    return {"path": voiceover_path, "speaker_gender": args.speaker_gender}
+
+def _handle_create_voiceover_with_elevenlabs(args: ElevenLabsVoiceoverArgs) -> dict[str, Any]:
+    voiceover_path = _elevenlabs_tts.submit(args.script_text, args.speaker_gender, model_id=args.model_id)
+    return {"path": voiceover_path, "speaker_gender": args.speaker_gender, "model_id": args.model_id}
+
+@dataclass
+class PipelineContext:
+    """
+    Intermediate results derived from one transcript, shared across tool calls
+    """
+    gender: Optional[str] = None
+    # (script_text, use_elevenlabs) -> generated voiceover path
+    voiceover_paths: dict[Tuple[str, bool], str] = field(default_factory=dict)
+
+# Runs connection prewarming alongside the Gemini call in the auto-gender tool
+_prewarm_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prewarm")
+
+# Most recently used transcripts' contexts, keyed by sha256(transcript)
+_PIPELINE_CONTEXTS: "OrderedDict[str, PipelineContext]" = OrderedDict()
+_PIPELINE_CONTEXTS_MAX = 64
+_pipeline_contexts_lock = threading.Lock()
+
+def _get_pipeline_context(transcript: str) -> PipelineContext:
+    key = hashlib.sha256(transcript.encode("utf-8")).hexdigest()
+    with _pipeline_contexts_lock:
+        ctx = _PIPELINE_CONTEXTS.get(key)
+        if ctx is None:
+            ctx = _PIPELINE_CONTEXTS[key] = PipelineContext()
+            if len(_PIPELINE_CONTEXTS) > _PIPELINE_CONTEXTS_MAX:
+                _PIPELINE_CONTEXTS.popitem(last=False)
+        else:
+            _PIPELINE_CONTEXTS.move_to_end(key)
+        return ctx
+
+def _handle_create_voiceover_with_auto_gender(args: AutoGenderVoiceoverArgs) -> dict[str, Any]:
+    script_text = args.script_text
+    transcript = args.transcript
+    use_elevenlabs = args.use_elevenlabs
+    
+    # Repeated pipeline runs over the same transcript reuse earlier results
+    ctx = _get_pipeline_context(transcript)
+    
+    # Detect speaker gender from transcript
+    if ctx.gender is None:
+        # The voice depends on the gender, but the connection doesn't: open
+        # it while Gemini classifies the speaker
+        if use_elevenlabs:
+            _prewarm_executor.submit(prewarm_elevenlabs_connection)
+        logger.info("Detecting speaker gender for voiceover")
+        _report_progress("detecting speaker gender")
+        ctx.gender = detect_speaker_gender(transcript)
+    speaker_gender = ctx.gender
+    logger.info("Speaker gender: %s", speaker_gender)
+    
+    # Create voiceover with appropriate voice, unless this exact one exists
+    voiceover_key = (script_text, use_elevenlabs)
+    voiceover_path = ctx.voiceover_paths.get(voiceover_key)
+    if voiceover_path is None or not os.path.exists(voiceover_path):
+        _report_progress(f"generating {speaker_gender} voiceover")
+        if use_elevenlabs:
+            voiceover_path = _elevenlabs_tts.submit(script_text, speaker_gender)
+        else:
+            voiceover_path = _local_tts.submit(script_text, speaker_gender)
+        ctx.voiceover_paths[voiceover_key] = voiceover_path
+    
+    return {"path": voiceover_path, "speaker_gender": speaker_gender}
+
+def _handle_create_looped_video_from_script(args: LoopedVideoFromScriptArgs) -> dict[str, Any]:
+    video_path = create_sample_loop_video_from_script(
+        args.script, background_video=args.background_video, progress_callback=_report_progress,
+        api_key=ELEVENLABS_API_KEY
+    )
+    return {"path": video_path}
+
+def _handle_create_looped_video_from_audio(args: LoopedVideoFromAudioArgs) -> dict[str, Any]:
+    _report_progress("rendering looped video")
+    video_path = create_looped_video_with_audio(args.audio_path, args.background_video)
+    return {"path": video_path}
+
+# Background jobs by ID; finished jobs are kept (up to _JOBS_MAX) so their
+# results can still be fetched
+_JOBS: "OrderedDict[str, asyncio.Task]" = OrderedDict()
+_JOBS_MAX = 256
+
+def _start_job(coro) -> str:
+    job_id = uuid.uuid4().hex
+    _JOBS[job_id] = asyncio.create_task(coro)
+    while len(_JOBS) > _JOBS_MAX:
+        oldest_id, oldest = next(iter(_JOBS.items()))
+        if not oldest.done():
+            break
+        del _JOBS[oldest_id]
+    return job_id
+
+def _get_job(job_id: str) -> asyncio.Task:
+    task = _JOBS.get(job_id)
+    if task is None:
+        raise Exception(f"Unknown job: {job_id}")
+    return task
+
+async def _handle_get_job_status(args: JobArgs) -> dict[str, Any]:
+    task = _get_job(args.job_id)
+    if not task.done():
+        return {"job_id": args.job_id, "state": "running"}
+    # exception() raises CancelledError on a cancelled task, so check first
+    if task.cancelled():
+        return {"job_id": args.job_id, "state": "cancelled"}
+    if task.exception() is not None:
+        return {"job_id": args.job_id, "state": "failed", "error": str(task.exception())}
+    return {"job_id": args.job_id, "state": "done"}
+
+async def _handle_get_job_result(args: JobArgs) -> dict[str, Any]:
+    task = _get_job(args.job_id)
+    if not task.done():
+        return {"job_id": args.job_id, "state": "running"}
+    if task.cancelled():
+        return {"job_id": args.job_id, "state": "cancelled"}
+    # Re-raises the job's own exception, reported like any tool error
+    return task.result()
+
+# Tool name -> handler, built once so dispatch is a single dict lookup
+# (handlers are sync functions run on a worker thread, or coroutines that
+# manage their own offloading)
+_HANDLERS: dict[str, Callable[[Any], Any]] = {
+    "download_youtube_audio": _handle_download_youtube_audio,
+    "youtube_to_viral_moments": _handle_youtube_to_viral_moments,
+    "transcribe_audio": _handle_transcribe_audio,
+    "find_viral_moments": _handle_find_viral_moments,
+    "generate_short_script": _handle_generate_short_script,
+    "generate_comprehensive_script": _handle_generate_comprehensive_script,
+    "create_voiceover": _handle_create_voiceover,
+    "create_voiceover_with_elevenlabs": _handle_create_voiceover_with_elevenlabs,
+    "create_voiceover_with_auto_gender": _handle_create_voiceover_with_auto_gender,
+    "create_looped_video_from_script": _handle_create_looped_video_from_script,
+    "create_looped_video_from_audio": _handle_create_looped_video_from_audio,
+    "get_job_status": _handle_get_job_status,
+    "get_job_result": _handle_get_job_result,
+}
+
+# Tool name -> argument model, kept alongside the dispatch table
+_ARG_MODELS: dict[str, type[BaseModel]] = {
+    "download_youtube_audio": DownloadYoutubeAudioArgs,
+    "youtube_to_viral_moments": YoutubeToViralMomentsArgs,
+    "transcribe_audio": TranscribeAudioArgs,
+    "find_viral_moments": FindViralMomentsArgs,
+    "generate_short_script": GenerateShortScriptArgs,
+    "generate_comprehensive_script": GenerateComprehensiveScriptArgs,
+    "create_voiceover": VoiceoverArgs,
+    "create_voiceover_with_elevenlabs": ElevenLabsVoiceoverArgs,
+    "create_voiceover_with_auto_gender": AutoGenderVoiceoverArgs,
+    "create_looped_video_from_script": LoopedVideoFromScriptArgs,
+    "create_looped_video_from_audio": LoopedVideoFromAudioArgs,
+    "get_job_status": JobArgs,
+    "get_job_result": JobArgs,
+}
+
+# Bound concurrent heavy jobs per resource class: GPU model inference is
+# sized to the GPU (MAX_GPU_JOBS), FFmpeg renders to the CPU cores, and
+# downloads/TTS API calls to a fixed connection budget. Separate pools keep
+# one class of job from starving the others.
+_GPU_SEM = asyncio.Semaphore(int(os.getenv("MAX_GPU_JOBS", "1")))
+_CPU_SEM = asyncio.Semaphore(os.cpu_count() or 1)
+_NET_SEM = asyncio.Semaphore(8)
+
+_TOOL_LIMITS: dict[str, asyncio.Semaphore] = {
+    "download_youtube_audio": _NET_SEM,
+    "transcribe_audio": _GPU_SEM,
+    "create_voiceover": _GPU_SEM,
+    "create_voiceover_with_elevenlabs": _NET_SEM,
+    "create_looped_video_from_script": _CPU_SEM,
+    "create_looped_video_from_audio": _CPU_SEM,
+}
+
+def _tool_limit(name: str, args: BaseModel):
+    # Auto-gender voiceover runs on ElevenLabs or local Coqui depending on its arguments
+    if isinstance(args, AutoGenderVoiceoverArgs):
+        return _NET_SEM if args.use_elevenlabs else _GPU_SEM
+    return _TOOL_LIMITS.get(name, contextlib.nullcontext())
+
+async def _run_handler(name: str, handler: Callable[[Any], Any], args: BaseModel) -> dict[str, Any]:
+    # Tools are blocking (network, Whisper, TTS, FFmpeg); run them on a
+    # worker thread so the event loop keeps serving other requests
+    async with _tool_limit(name, args):
+        if asyncio.iscoroutinefunction(handler):
+            return await handler(args)
+        return await asyncio.to_thread(handler, args)
+
+# Results are JSON objects rather than prose, so clients can read paths and
+# transcripts straight out of them and chain tools without re-parsing
+def _result_content(result: dict[str, Any]) -> list[TextContent]:
+    return [TextContent(type="text", text=json.dumps({"status": "ok", **result}))]
+
+def _error_content(message: str) -> list[TextContent]:
+    return [TextContent(type="text", text=json.dumps({"status": "error", "error": message}))]
 
 @server.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     """
     Handle tool calls for the viral moment content pipeline
     """
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return _error_content(f"Unknown tool: {name}")
+    
     try:
-        if name == "download_youtube_audio":
-            from tools.youtube_tool import get_audio_from_youtube
-            url = arguments["url"]
-            audio_path = get_audio_from_youtube(url)
-            return [TextContent(type="text", text=f"Audio downloaded successfully: {audio_path}")]
+        args = _ARG_MODELS[name].model_validate(arguments or {})
         
-        elif name == "transcribe_audio":
-            from tools.transcription_tool import transcribe_audio
-            audio_path = arguments["audio_path"]
-            transcript = transcribe_audio(audio_path)
-            return [TextContent(type="text", text=f"Transcript: {transcript}")]
+        # Jobs outlive this request, so they start before a progress
+        # reporter tied to it is installed
+        if getattr(args, "background", False):
+            job_id = _start_job(_run_handler(name, handler, args))
+            return _result_content({"job_id": job_id, "state": "running"})
         
-        elif name == "find_viral_moments":
-            from tools.llm_tool import find_key_moments
-            transcript = arguments["transcript"]
-            moments = find_key_moments(transcript)
-            return [TextContent(type="text", text=f"Viral moments found: {moments}")]
+        # MCP tool results can't be streamed, so long-running tools report their
+        # stages as progress notifications; to_thread copies this context, which
+        # carries the reporter into the worker thread
+        progress_token = _progress_token()
+        if progress_token is not None:
+            _progress_reporter.set(_make_progress_reporter(progress_token, asyncio.get_running_loop()))
         
-        elif name == "generate_short_script":
-            from tools.llm_tool import generate_short_script
-            moment_summary = arguments["moment_summary"]
-            script = generate_short_script(moment_summary)
-            return [TextContent(type="text", text=f"Generated script: {script}")]
-        
-        elif name == "generate_comprehensive_script":
-            from tools.llm_tool import generate_comprehensive_script
-            viral_moments = arguments["viral_moments"]
-            script = generate_comprehensive_script(viral_moments)
-            return [TextContent(type="text", text=f"Generated comprehensive script: {script}")]
-        
-        elif name == "create_voiceover":
-            from tools.voice_tool import create_voiceover
-            script_text = arguments["script_text"]
-            speaker_gender = arguments.get("speaker_gender", "unknown")
-            voiceover_path = create_voiceover(script_text, speaker_gender=speaker_gender)
-            return [TextContent(type="text", text=f"Voiceover created with {speaker_gender} voice: {voiceover_path}")]
-        
-        elif name == "create_voiceover_with_elevenlabs":
-            from tools.voice_tool import create_voiceover_with_elevenlabs
-            script_text = arguments["script_text"]
-            speaker_gender = arguments.get("speaker_gender", "unknown")
-            voiceover_path = create_voiceover_with_elevenlabs(script_text, speaker_gender=speaker_gender)
-            return [TextContent(type="text", text=f"High-quality voiceover created with {speaker_gender} voice: {voiceover_path}")]
-        
-        elif name == "create_voiceover_with_auto_gender":
-            from tools.voice_tool import create_voiceover, create_voiceover_with_elevenlabs
-            from tools.llm_tool import detect_speaker_gender
-            script_text = arguments["script_text"]
-            transcript = arguments["transcript"]
-            use_elevenlabs = arguments.get("use_elevenlabs", True)
-            
-            # Detect speaker gender from transcript
-            print("🔍 Detecting speaker gender for voiceover...")
-            speaker_gender = detect_speaker_gender(transcript)
-            print(f"🎤 Detected speaker gender: {speaker_gender}")
-            
-            # Create voiceover with appropriate voice
-            if use_elevenlabs:
-                voiceover_path = create_voiceover_with_elevenlabs(script_text, speaker_gender=speaker_gender)
-            else:
-                voiceover_path = create_voiceover(script_text, speaker_gender=speaker_gender)
-            
-            return [TextContent(type="text", text=f"Voiceover created with auto-detected {speaker_gender} voice: {voiceover_path}")]
-        
-        
-
-        elif name == "create_looped_video_from_script":
-            from tools.video_tool import create_sample_loop_video_from_script
-            script = arguments["script"]
-            background_video = arguments.get("background_video", "Sample_Video.mp4")
-            video_path = create_sample_loop_video_from_script(script, background_video=background_video)
-            return [TextContent(type="text", text=f"Looped background video created: {video_path}")]
-
-        elif name == "create_looped_video_from_audio":
-            from tools.video_tool import create_looped_video_with_audio
-            audio_path = arguments["audio_path"]
-            background_video = arguments.get("background_video", "Sample_Video.mp4")
-            video_path = create_looped_video_with_audio(audio_path, background_video)
-            return [TextContent(type="text", text=f"Looped background video created: {video_path}")]
-        
-        else:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
+        result = await _run_handler(name, handler, args)
+        return _result_content(result)
     
     except Exception as e:
-        return [TextContent(type="text", text=f"Error executing {name}: {str(e)}")]
+        return _error_content(f"Error executing {name}: {str(e)}")
+
+async def _warm_up_models() -> None:
+    # Pay model load (and Whisper kernel warm-up) before the first request
+    # instead of on its critical path; a failure here only costs latency later
+    results = await asyncio.gather(
+        asyncio.to_thread(warm_up_whisper, WHISPER_MODEL),
+        asyncio.to_thread(warm_up_tts),
+        return_exceptions=True,
+    )
+    for model_name, result in zip(("Whisper", "TTS"), results):
+        if isinstance(result, Exception):
+            logger.warning("Could not preload %s model: %s", model_name, result)
 
 async def main():
     """
     Main function to run the MCP server
     """
-    print("Starting AI-Powered Viral Moment Content Pipeline Server...")
-    print("Available tools:")
-    print("- download_youtube_audio: Download audio from YouTube videos")
-    print("- transcribe_audio: Transcribe audio using local Whisper")
-    print("- find_viral_moments: Find ALL viral moments using Gemini AI (no limit)")
-    print("- generate_short_script: Generate dynamic-length scripts covering all viral moments")
-    print("- generate_comprehensive_script: Generate comprehensive scripts from detailed viral moments")
-    print("- create_voiceover: Generate voiceovers using local TTS with gender support")
-    print("- create_voiceover_with_elevenlabs: Generate high-quality voiceovers using ElevenLabs TTS")
-    print("- create_voiceover_with_auto_gender: Generate voiceover with automatic gender detection")
-    print("- create_engaging_video: Create engaging videos with multiple scenes, animations, and effects")
-    print("- create_video_with_auto_voice: Create video with automatic gender detection and appropriate voice")
+    logger.info("Starting AI-Powered Viral Moment Content Pipeline Server...")
+    logger.info("Available tools:")
+    logger.info("- download_youtube_audio: Download audio from YouTube videos")
+    logger.info("- transcribe_audio: Transcribe audio using local Whisper")
+    logger.info("- youtube_to_viral_moments: Download, transcribe and find viral moments in one call")
+    logger.info("- find_viral_moments: Find ALL viral moments using Gemini AI (no limit)")
+    logger.info("- generate_short_script: Generate dynamic-length scripts covering all viral moments")
+    logger.info("- generate_comprehensive_script: Generate comprehensive scripts from detailed viral moments")
+    logger.info("- create_voiceover: Generate voiceovers using local TTS with gender support")
+    logger.info("- create_voiceover_with_elevenlabs: Generate high-quality voiceovers using ElevenLabs TTS")
+    logger.info("- create_voiceover_with_auto_gender: Generate voiceover with automatic gender detection")
+    logger.info("- create_engaging_video: Create engaging videos with multiple scenes, animations, and effects")
+    logger.info("- create_video_with_auto_voice: Create video with automatic gender detection and appropriate voice")
+    logger.info("- get_job_status / get_job_result: Poll tools started with background=true")
+    
+    if PRELOAD_MODELS:
+        logger.info("Preloading Whisper and TTS models...")
+        await _warm_up_models()
     
     # Run the server
     await server.run()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    _log_listener.start()
+    # uvloop has cheaper callbacks than the default loop; it isn't available on Windows
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    try:
+        asyncio.run(main())
+    finally:
+        _log_listener.stop()
@@ -5,8 +5,11 @@ Beautiful demo interface for the viral content creation pipeline
 
 import streamlit as st
 import os
+import asyncio
 import tempfile
 import json
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
 import time
@@ -14,19 +17,276 @@ import time
 # Load environment variables
 load_dotenv()
 
-# Check if API keys are already configured
-GOOGLE_API_KEY = os.getenv('GOOGLE_API_KEY')
-
-# Page configuration
-st.set_page_config(
-    page_title="Viral Moment Pipeline",
-    page_icon="",
-    layout="wide",
-    initial_sidebar_state="expanded"
+# Imported once per process; Streamlit reruns reuse the loaded modules
+from tools import (
+    get_audio_from_youtube, transcribe_audio, find_key_moments,
+    generate_scripts_batch, generate_comprehensive_script, create_voiceover,
+    create_high_quality_voiceover, create_looped_video_with_audio
 )
+from tools.elevenlabs_video_tool import create_elevenlabs_video
+from tools.hashutil import bytes_digest
+from tools.llm_tool import _classify_speaker_gender
+
+# Check which API keys are configured, once per run
+_KEY_LABELS = {"GOOGLE_API_KEY": "Google API Key"}
+_MISSING = frozenset(key for key in _KEY_LABELS if not os.getenv(key))
+HAS_GOOGLE = "GOOGLE_API_KEY" not in _MISSING
+
+# Upper bound on tool calls in flight at once, to stay inside API rate limits
+MAX_CONCURRENT_CALLS = 4
+
+# Output directories shown in the File Management and Analytics tabs
+GENERATED_DIRS = ["downloads", "generated_audio", "generated_graphics"]
+
+
+async def _gather_calls(*calls):
+    """
+    Run blocking tool calls concurrently on worker threads
+    
+    Args:
+        *calls: (function, *args) tuples
+        
+    Returns:
+        list: Each call's result, in the order given
+    """
+    # Created per run: asyncio.run() starts a fresh event loop on every click
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CALLS)
+    
+    async def run(fn, *args):
+        async with semaphore:
+            return await asyncio.to_thread(fn, *args)
+    
+    return await asyncio.gather(*(run(*call) for call in calls))
+
+
+def throttled_progress(progress_bar, start: int, end: int, min_interval: float = 0.05):
+    """
+    Build a progress callback that maps a 0-1 fraction onto part of a progress bar
+    
+    Each update re-renders the widget, so updates closer together than
+    min_interval (20 Hz by default) are dropped; completion always goes through.
+    
+    Args:
+        progress_bar: Streamlit progress bar to update
+        start (int): Bar value at fraction 0
+        end (int): Bar value at fraction 1
+        min_interval (float): Minimum seconds between updates
+        
+    Returns:
+        Callable[[float], None]: The progress callback
+    """
+    last_update = 0.0
+    
+    def update(fraction: float) -> None:
+        nonlocal last_update
+        now = time.monotonic()
+        if fraction < 1 and now - last_update < min_interval:
+            return
+        last_update = now
+        progress_bar.progress(start + int((end - start) * min(max(fraction, 0.0), 1.0)))
+    
+    return update
+
+
+def run_with_progress(fn, progress_callback, poll_interval: float = 0.05, **kwargs):
+    """
+    Run a long tool call on a worker thread while forwarding its progress
+    
+    The tool reports progress from the worker into a queue; this thread
+    drains it every poll_interval and passes the latest fraction on, so
+    Streamlit widgets are still only touched from the script thread.
+    
+    Args:
+        fn: Tool function accepting a progress_callback keyword argument
+        progress_callback: Callback run on this thread with each 0-1 fraction
+        poll_interval (float): Seconds between queue checks
+        **kwargs: Arguments passed through to fn
+        
+    Returns:
+        Any: fn's result (its exception is re-raised here)
+    """
+    updates = queue.Queue()
+    
+    def drain() -> None:
+        latest = None
+        while True:
+            try:
+                latest = updates.get_nowait()
+            except queue.Empty:
+                break
+        if latest is not None:
+            progress_callback(latest)
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(fn, progress_callback=updates.put, **kwargs)
+        while not future.done():
+            drain()
+            time.sleep(poll_interval)
+    drain()
+    return future.result()
+
+
+def download_file_button(label: str, file_path: str, mime: str) -> None:
+    """
+    Render a download button for a generated file
+    
+    The open file is handed to Streamlit rather than read into a bytes object
+    here, and the click doesn't rerun the app.
+    
+    Args:
+        label (str): Button label
+        file_path (str): File to offer for download
+        mime (str): MIME type of the file
+    """
+    if not os.path.exists(file_path):
+        st.caption(f"{os.path.basename(file_path)} is no longer available")
+        return
+    with open(file_path, "rb") as file:
+        st.download_button(
+            label=label,
+            data=file,
+            file_name=os.path.basename(file_path),
+            mime=mime,
+            on_click="ignore",
+            use_container_width=True
+        )
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def list_generated_files(directory: str):
+    """
+    List the files in an output directory
+    
+    One scandir pass; DirEntry carries the type and stat info from the
+    directory read, so there's no separate stat per file. Both file tabs
+    read this one cached listing; the app clears it whenever it writes or
+    removes files, and the TTL picks up changes made outside the app.
+    
+    Args:
+        directory (str): Directory to list
+        
+    Returns:
+        list: (file name, size in bytes) tuples, or None if the directory doesn't exist
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [(entry.name, entry.stat().st_size) for entry in entries if entry.is_file()]
+    except FileNotFoundError:
+        return None
+
+
+# Moment fields shown in the pipeline's per-moment details, in display order
+MOMENT_FIELDS = [
+    ("summary", "Summary"),
+    ("timestamp", "Timestamp"),
+    ("viral_factor", "Viral Factor"),
+    ("quote", "Quote"),
+    ("hook", "Hook"),
+    ("confidence", "Confidence")
+]
+
+
+def moment_table(moment: dict) -> str:
+    """
+    Format a viral moment's details as one Markdown table
+    
+    Rendered with a single st.markdown call instead of an element per field.
+    
+    Args:
+        moment (dict): Viral moment from find_key_moments
+        
+    Returns:
+        str: Markdown table with one row per field
+    """
+    rows = ["| | |", "|---|---|"]
+    for key, label in MOMENT_FIELDS:
+        # Keep LLM text from breaking the table
+        value = str(moment.get(key, 'N/A')).replace("|", "\\|").replace("\n", " ")
+        rows.append(f"| **{label}** | {value} |")
+    return "\n".join(rows)
+
+
+# Streamlit reruns this script on every widget interaction; these keep
+# transcripts and Gemini results across reruns instead of recomputing them.
+# The Whisper model itself is already loaded once per process by
+# tools.transcription_tool.load_whisper_model.
+@st.cache_data(show_spinner=False)
+def _transcribe_cached(audio_key, _audio_path: str) -> str:
+    return transcribe_audio(_audio_path)
+
+
+def transcribe_cached(audio_path: str) -> str:
+    """
+    Transcribe audio, reusing the result from an earlier rerun
+    
+    Args:
+        audio_path (str): Path to the audio file to transcribe
+        
+    Returns:
+        str: Full text transcript
+    """
+    # Keyed by file identity rather than content so a cache hit never has to
+    # read the audio back in; the transcription tool's disk cache covers
+    # identical content under a different name
+    stat = os.stat(audio_path)
+    audio_key = (os.path.realpath(audio_path), stat.st_mtime_ns, stat.st_size, os.getenv('WHISPER_MODEL', 'base'))
+    return _transcribe_cached(audio_key, audio_path)
+
+
+@st.cache_data(show_spinner=False)
+def _transcribe_upload_cached(audio_digest: str, whisper_model: str, _audio_bytes: bytes, _suffix: str) -> str:
+    with tempfile.NamedTemporaryFile(delete=False, suffix=_suffix) as tmp_file:
+        tmp_file.write(_audio_bytes)
+        tmp_path = tmp_file.name
+    try:
+        return transcribe_audio(tmp_path)
+    finally:
+        os.unlink(tmp_path)
+
+
+def transcribe_upload(uploaded_file) -> str:
+    """
+    Transcribe an uploaded audio file, reusing the result for a repeat upload
+    
+    Uploads are keyed by a hash of their bytes, so the same file uploaded
+    again skips both the temp-file write and Whisper.
+    
+    Args:
+        uploaded_file: File returned by st.file_uploader
+        
+    Returns:
+        str: Full text transcript
+    """
+    audio_bytes = uploaded_file.getvalue()
+    audio_digest = bytes_digest(audio_bytes)
+    return _transcribe_upload_cached(
+        audio_digest, os.getenv('WHISPER_MODEL', 'base'), audio_bytes, Path(uploaded_file.name).suffix
+    )
+
+
+@st.cache_data(show_spinner=False)
+def find_key_moments_cached(transcript: str):
+    return find_key_moments(transcript)
+
+
+@st.cache_data(show_spinner=False)
+def _classify_speaker_gender_cached(transcript_excerpt: str) -> str:
+    return _classify_speaker_gender(transcript_excerpt)
 
-# Custom CSS for better styling
-st.markdown("""
+
+def detect_speaker_gender_cached(transcript: str) -> str:
+    # detect_speaker_gender turns any failure into "unknown", which would be
+    # cached for good; here the error escapes the cached call instead, so a
+    # transient Gemini failure is retried on the next run
+    try:
+        # Only the first 1000 characters reach the prompt, so they are the cache key
+        return _classify_speaker_gender_cached(transcript[:1000])
+    except Exception as e:
+        print(f"Warning: Could not detect speaker gender: {e}")
+        return "unknown"
+
+# Page styles, injected once per run below
+_CSS = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -67,20 +327,49 @@ st.markdown("""
         margin: 1rem 0;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Page configuration
+st.set_page_config(
+    page_title="Viral Moment Pipeline",
+    page_icon="",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Custom CSS for better styling. st.html injects it as-is, skipping the
+# Markdown parser; it is sent on every rerun because Streamlit drops any
+# element a rerun doesn't re-emit
+st.html(_CSS)
 
 # Header
 st.markdown('<h1 class="main-header">AI-Powered Viral Moment Content Pipeline</h1>', unsafe_allow_html=True)
 st.markdown("Transform long-form YouTube videos into viral short-form content automatically!")
 
-# Sidebar for configuration
-with st.sidebar:
+# Downloads for the last pipeline run. As a fragment, its own widgets rerun
+# just this section rather than the whole app and the pipeline tab
+@st.fragment
+def render_downloads(outputs: dict):
+    st.header("Download Generated Content")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        download_file_button("Download Audio", outputs["audio_path"], "audio/mpeg")
+    
+    with col2:
+        download_file_button("Download Voiceover", outputs["voiceover_path"], "audio/wav")
+    
+    with col3:
+        download_file_button("Download Video", outputs["video_path"], "video/mp4")
+
+# Sidebar for configuration. As a fragment, changing one of its own widgets
+# (e.g. the Whisper model) reruns just the sidebar instead of the whole app
+@st.fragment
+def render_sidebar():
     st.header(" Configuration")
     
     # Check if API keys are already loaded from .env
-    keys_configured = GOOGLE_API_KEY
-    
-    if keys_configured:
+    if not _MISSING:
         st.success("API keys loaded from .env file")
         st.info(" All API keys are configured and ready to use!")
     else:
@@ -89,11 +378,12 @@ with st.sidebar:
         # Only show input fields if keys are missing
         st.subheader(" Missing API Keys")
         
-        if not GOOGLE_API_KEY:
+        if not HAS_GOOGLE:
             google_key = st.text_input("Google API Key", type="password", help="Get from Google AI Studio")
             if google_key:
                 os.environ['GOOGLE_API_KEY'] = google_key
-                GOOGLE_API_KEY = google_key
+                # The key gates widgets outside this fragment, so rerun the whole app
+                st.rerun()
         else:
             st.success(" Google API Key configured")
             
@@ -103,25 +393,32 @@ with st.sidebar:
     
     # Settings
     st.subheader("Settings")
-    whisper_model = st.selectbox("Whisper Model", ["base", "small", "medium", "large"], 
-                                index=["base", "small", "medium", "large"].index(os.getenv('WHISPER_MODEL', 'base')))
-    os.environ['WHISPER_MODEL'] = whisper_model
+    # Loaded models stay cached per name (see load_whisper_model), so
+    # switching back to an earlier choice doesn't reload it
+    whisper_models = ["base", "small", "medium", "large"]
+    current_model = os.getenv('WHISPER_MODEL', 'base')
+    if current_model not in whisper_models:
+        # e.g. a converted model directory configured in .env
+        whisper_models.append(current_model)
+    whisper_model = st.selectbox("Whisper Model", whisper_models, index=whisper_models.index(current_model))
+    if whisper_model != current_model:
+        os.environ['WHISPER_MODEL'] = whisper_model
     
     st.divider()
     
     # Status
     st.subheader("Status")
-    if GOOGLE_API_KEY:
+    if not _MISSING:
         st.success("All API keys configured")
         st.info("Ready to process videos!")
     else:
-        missing_keys = []
-        if not GOOGLE_API_KEY:
-            missing_keys.append("Google API Key")
-        
-        st.error(f"Missing: {', '.join(missing_keys)}")
+        st.error(f"Missing: {', '.join(_KEY_LABELS[key] for key in sorted(_MISSING))}")
         st.info("Add missing keys to your .env file or use the sidebar")
 
+
+with st.sidebar:
+    render_sidebar()
+
 # Main content
 tab1, tab2, tab3, tab4 = st.tabs([" Complete Pipeline", "Individual Tools", "File Upload", "Analytics"])
 
@@ -132,30 +429,29 @@ with tab1:
     # YouTube URL input
     youtube_url = st.text_input("YouTube Video URL", placeholder="https://www.youtube.com/watch?v=...")
     
-    if st.button("Generate Viral Content", type="primary", disabled=not GOOGLE_API_KEY):
+    if st.button("Generate Viral Content", type="primary", disabled=not HAS_GOOGLE):
         if not youtube_url:
             st.error("Please enter a YouTube URL")
         else:
-            # Progress bar
-            progress_bar = st.progress(0)
-            status_text = st.empty()
+            # Stage label and progress bar live in one status card
+            status = st.status("Generating viral content...", expanded=True)
+            progress_bar = status.progress(0)
             
             try:
                 # Step 1: Download YouTube audio
-                status_text.text("Step 1/6: Downloading YouTube audio...")
-                progress_bar.progress(16)
+                status.update(label="Step 1/6: Downloading YouTube audio...", state="running")
                 
-                from tools.youtube_tool import get_audio_from_youtube
-                audio_path = get_audio_from_youtube(youtube_url)
+                audio_path = get_audio_from_youtube(
+                    youtube_url, progress_callback=throttled_progress(progress_bar, 0, 16)
+                )
                 
                 st.success(f"Audio downloaded: {os.path.basename(audio_path)}")
                 
                 # Step 2: Transcribe audio
-                status_text.text("Step 2/6: Transcribing audio...")
+                status.update(label="Step 2/6: Transcribing audio...")
                 progress_bar.progress(33)
                 
-                from tools.transcription_tool import transcribe_audio
-                transcript = transcribe_audio(audio_path)
+                transcript = transcribe_cached(audio_path)
                 
                 st.success(f"Transcript completed ({len(transcript)} characters)")
                 
@@ -164,14 +460,16 @@ with tab1:
                     st.text(transcript)
                 
                 # Step 3: Find viral moments
-                status_text.text("Step 3/6: Finding viral moments...")
+                status.update(label="Step 3/6: Finding viral moments...")
                 progress_bar.progress(50)
                 
-                from tools.llm_tool import find_key_moments, detect_speaker_gender
-                moments = find_key_moments(transcript)
+                # Both Gemini calls only need the transcript, so they run side by side;
+                # Streamlit widgets are only touched from this thread, after they finish
+                moments, speaker_gender = asyncio.run(_gather_calls(
+                    (find_key_moments_cached, transcript),
+                    (detect_speaker_gender_cached, transcript)
+                ))
                 
-                # Detect speaker gender
-                speaker_gender = detect_speaker_gender(transcript)
                 st.info(f"🎤 Detected speaker gender: {speaker_gender.title()}")
                 
                 st.success(f"Found {len(moments)} viral moments")
@@ -179,22 +477,13 @@ with tab1:
                 # Display viral moments
                 for i, moment in enumerate(moments, 1):
                     with st.expander(f"Viral Moment {i}: {moment.get('summary', 'No summary')[:50]}..."):
-                        col1, col2 = st.columns(2)
-                        with col1:
-                            st.write(f"**Summary:** {moment.get('summary', 'N/A')}")
-                            st.write(f"**Timestamp:** {moment.get('timestamp', 'N/A')}")
-                            st.write(f"**Viral Factor:** {moment.get('viral_factor', 'N/A')}")
-                        with col2:
-                            st.write(f"**Quote:** {moment.get('quote', 'N/A')}")
-                            st.write(f"**Hook:** {moment.get('hook', 'N/A')}")
-                            st.write(f"**Confidence:** {moment.get('confidence', 'N/A')}")
+                        st.markdown(moment_table(moment))
                 
                 if moments:
                     # Step 4: Generate comprehensive script from all viral moments
-                    status_text.text("Step 4/6: Generating comprehensive script from all viral moments...")
+                    status.update(label="Step 4/6: Generating comprehensive script from all viral moments...")
                     progress_bar.progress(66)
                     
-                    from tools.llm_tool import generate_comprehensive_script
                     script = generate_comprehensive_script(moments, speaker_gender)
                     
                     st.success("Comprehensive script generated from all viral moments")
@@ -204,10 +493,9 @@ with tab1:
                         st.text(script)
                     
                     # Step 5: Create ElevenLabs voiceover
-                    status_text.text(" Step 5/7: Creating ElevenLabs voiceover...")
+                    status.update(label="Step 5/6: Creating ElevenLabs voiceover...")
                     progress_bar.progress(71)
                     
-                    from tools.voice_tool import create_high_quality_voiceover
                     voiceover_path = create_high_quality_voiceover(script)
                     
                     st.success(f"Voiceover created: {os.path.basename(voiceover_path)}")
@@ -216,16 +504,18 @@ with tab1:
                     st.audio(voiceover_path)
                     
                     # Step 6: Create looped video using Sample_Video.mp4 and ElevenLabs audio
-                    status_text.text("Step 6/7: Creating looped video with Sample_Video.mp4...")
+                    status.update(label="Step 6/6: Creating looped video with Sample_Video.mp4...")
                     progress_bar.progress(85)
                     
-                    from tools.video_tool import create_looped_video_with_audio
                     background_video = "Sample_Video.mp4"
                     # Resolve to absolute path next to this app file
                     if not os.path.isabs(background_video):
                         background_video = str((Path(__file__).parent / background_video).resolve())
                     
-                    video_path = create_looped_video_with_audio(
+                    # FFmpeg renders on a worker thread; this thread keeps the bar moving
+                    video_path = run_with_progress(
+                        create_looped_video_with_audio,
+                        throttled_progress(progress_bar, 85, 99),
                         voiceover_path=voiceover_path,
                         background_video_path=background_video
                     )
@@ -236,49 +526,30 @@ with tab1:
                     st.video(video_path)
                     
                     # Step 7: Pipeline complete
-                    status_text.text("Pipeline Complete!")
                     progress_bar.progress(100)
+                    status.update(label="Pipeline completed successfully!", state="complete")
                     
                     st.success("All content generated successfully!")
                     
-                    # Final results
-                    status_text.text("Pipeline completed successfully!")
-                    
-                    # Download section
-                    st.header("Download Generated Content")
-                    col1, col2, col3 = st.columns(3)
-                    
-                    with col1:
-                        with open(audio_path, "rb") as file:
-                            st.download_button(
-                                label="Download Audio",
-                                data=file.read(),
-                                file_name=os.path.basename(audio_path),
-                                mime="audio/mpeg"
-                            )
-                    
-                    with col2:
-                        with open(voiceover_path, "rb") as file:
-                            st.download_button(
-                                label="Download Voiceover",
-                                data=file.read(),
-                                file_name=os.path.basename(voiceover_path),
-                                mime="audio/wav"
-                            )
-                    
-                    with col3:
-                        with open(video_path, "rb") as file:
-                            st.download_button(
-                                label="Download Video",
-                                data=file.read(),
-                                file_name=os.path.basename(video_path),
-                                mime="video/mp4"
-                            )
+                    # Kept in session state so the downloads survive later reruns
+                    st.session_state["pipeline_outputs"] = {
+                        "audio_path": audio_path,
+                        "voiceover_path": voiceover_path,
+                        "video_path": video_path
+                    }
+                else:
+                    status.update(label="No viral moments found", state="complete")
                 
             except Exception as e:
                 st.error(f"Error: {str(e)}")
-                progress_bar.progress(0)
-                status_text.text("Pipeline failed")
+                status.update(label="Pipeline failed", state="error")
+            finally:
+                # The run may have written files, even if it failed part way
+                list_generated_files.clear()
+    
+    # Download section, for the most recent successful run
+    if "pipeline_outputs" in st.session_state:
+        render_downloads(st.session_state["pipeline_outputs"])
 
 with tab2:
     st.header("Individual Tools")
@@ -290,8 +561,8 @@ with tab2:
         if st.button("Download Audio", key="download_btn"):
             if youtube_url_tool:
                 try:
-                    from tools.youtube_tool import get_audio_from_youtube
                     audio_path = get_audio_from_youtube(youtube_url_tool)
+                    list_generated_files.clear()
                     st.success(f"Downloaded: {os.path.basename(audio_path)}")
                     st.audio(audio_path)
                 except Exception as e:
@@ -304,18 +575,9 @@ with tab2:
         uploaded_audio = st.file_uploader("Upload Audio File", type=['mp3', 'wav', 'm4a'])
         if uploaded_audio and st.button("Transcribe Audio", key="transcribe_btn"):
             try:
-                # Save uploaded file
-                with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_audio.name.split('.')[-1]}") as tmp_file:
-                    tmp_file.write(uploaded_audio.read())
-                    tmp_path = tmp_file.name
-                
-                from tools.transcription_tool import transcribe_audio
-                transcript = transcribe_audio(tmp_path)
+                transcript = transcribe_upload(uploaded_audio)
                 st.success("Transcription completed!")
                 st.text_area("Transcript", transcript, height=200)
-                
-                # Clean up
-                os.unlink(tmp_path)
             except Exception as e:
                 st.error(f"Error: {e}")
     
@@ -327,10 +589,9 @@ with tab2:
         
         with col1:
             if st.button("Find Viral Moments", key="viral_btn"):
-                if transcript_text and GOOGLE_API_KEY:
+                if transcript_text and HAS_GOOGLE:
                     try:
-                        from tools.llm_tool import find_key_moments
-                        moments = find_key_moments(transcript_text)
+                        moments = find_key_moments_cached(transcript_text)
                         st.success(f"Found {len(moments)} viral moments")
                         for i, moment in enumerate(moments, 1):
                             st.write(f"**{i}.** {moment.get('summary', 'No summary')}")
@@ -340,14 +601,16 @@ with tab2:
                     st.error("Please enter transcript text and configure Google API key")
         
         with col2:
-            moment_summary = st.text_input("Moment Summary")
+            moment_summaries = st.text_area("Moment Summaries (one per line)", height=100)
             if st.button("Generate Script", key="script_btn"):
-                if moment_summary and GOOGLE_API_KEY:
+                summaries = [line.strip() for line in moment_summaries.splitlines() if line.strip()]
+                if summaries and HAS_GOOGLE:
                     try:
-                        from tools.llm_tool import generate_short_script
-                        script = generate_short_script(moment_summary)
-                        st.success("Script generated!")
-                        st.text_area("Generated Script", script, height=150)
+                        # All summaries go to Gemini in one request
+                        scripts = generate_scripts_batch(summaries)
+                        st.success(f"{len(scripts)} script(s) generated!")
+                        for i, script in enumerate(scripts, 1):
+                            st.text_area(f"Generated Script {i}", script, height=150)
                     except Exception as e:
                         st.error(f"Error: {e}")
                 else:
@@ -359,8 +622,8 @@ with tab2:
         if st.button("Generate Voiceover", key="voice_btn"):
             if script_text:
                 try:
-                    from tools.voice_tool import create_voiceover
                     voiceover_path = create_voiceover(script_text)
+                    list_generated_files.clear()
                     st.success("Voiceover generated!")
                     st.audio(voiceover_path)
                 except Exception as e:
@@ -387,7 +650,6 @@ with tab2:
         if st.button("Create ElevenLabs Video", key="elevenlabs_btn"):
             if video_script:
                 try:
-                    from tools.elevenlabs_video_tool import create_elevenlabs_video
                     video_path = create_elevenlabs_video(
                         script=video_script,
                         voice_id=voice_id,
@@ -411,28 +673,26 @@ with tab3:
     st.subheader("Generated Files")
     
     # Check for generated directories
-    directories = ["downloads", "generated_audio", "generated_graphics"]
-    
-    for directory in directories:
-        if os.path.exists(directory):
-            files = os.listdir(directory)
-            if files:
-                st.write(f"**{directory.title()}:**")
-                for file in files:
-                    file_path = os.path.join(directory, file)
-                    file_size = os.path.getsize(file_path)
-                    st.write(f"  - {file} ({file_size:,} bytes)")
-            else:
-                st.write(f"**{directory.title()}:** (empty)")
-        else:
+    for directory in GENERATED_DIRS:
+        files = list_generated_files(directory)
+        if files is None:
             st.write(f"**{directory.title()}:** (not created yet)")
+        elif files:
+            st.write(f"**{directory.title()}:**")
+            # One text element for the whole listing rather than one per file
+            st.text("\n".join(f"  - {file} ({file_size:,} bytes)" for file, file_size in files))
+        else:
+            st.write(f"**{directory.title()}:** (empty)")
     
     # File cleanup
     if st.button("Clean Generated Files"):
-        for directory in directories:
+        for directory in GENERATED_DIRS:
             if os.path.exists(directory):
-                for file in os.listdir(directory):
-                    os.remove(os.path.join(directory, file))
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            os.remove(entry.path)
+        list_generated_files.clear()
         st.success("Files cleaned up!")
 
 with tab4:
@@ -442,12 +702,7 @@ with tab4:
     st.subheader("Pipeline Statistics")
     
     # Count files in each directory
-    stats = {}
-    for directory in ["downloads", "generated_audio", "generated_graphics"]:
-        if os.path.exists(directory):
-            stats[directory] = len(os.listdir(directory))
-        else:
-            stats[directory] = 0
+    stats = {directory: len(list_generated_files(directory) or []) for directory in GENERATED_DIRS}
     
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -476,7 +731,7 @@ with tab4:
     st.subheader("API Status")
     
     api_status = {
-        "Google Gemini": "Configured" if GOOGLE_API_KEY else "Not configured",
+        "Google Gemini": "Configured" if HAS_GOOGLE else "Not configured",
     }
     
     for api, status in api_status.items():
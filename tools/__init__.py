@@ -3,14 +3,25 @@ Tools package for the AI-Powered Viral Moment Content Pipeline
 """
 
 from .youtube_tool import get_audio_from_youtube
-from .transcription_tool import transcribe_audio
-from .llm_tool import find_key_moments, generate_short_script
-from .voice_tool import create_voiceover
+from .transcription_tool import transcribe_audio, load_whisper_model
+from .llm_tool import (
+    find_key_moments, generate_short_script, generate_scripts_batch, generate_comprehensive_script,
+    detect_speaker_gender, get_llm_client
+)
+from .voice_tool import create_voiceover, create_high_quality_voiceover
+from .video_tool import create_looped_video_with_audio
 
 __all__ = [
     "get_audio_from_youtube",
     "transcribe_audio", 
+    "load_whisper_model",
     "find_key_moments",
     "generate_short_script",
-    "create_voiceover"
+    "generate_scripts_batch",
+    "generate_comprehensive_script",
+    "detect_speaker_gender",
+    "get_llm_client",
+    "create_voiceover",
+    "create_high_quality_voiceover",
+    "create_looped_video_with_audio"
 ]
@@ -1,12 +1,40 @@
+import io
+import json
 import os
+import shutil
 import tempfile
 import subprocess
-import requests
 import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 import textwrap
+from tools.hashutil import bytes_digest
+
+try:
+    from mutagen import File as MutagenFile
+except ImportError:
+    MutagenFile = None
+
+# Synthesized ElevenLabs audio keyed by voice, model, settings and text, so
+# regenerating a video for the same script doesn't pay for TTS again
+TTS_CACHE_DIR = Path(os.getenv('TTS_CACHE_DIR', 'cache/tts'))
+TTS_CACHE_MAX_BYTES = int(os.getenv('TTS_CACHE_MAX_BYTES', str(1024 ** 3)))
+
+# Worker threads for rendering a video's scenes in parallel (1 renders them
+# one after another in the calling thread)
+SCENE_RENDER_WORKERS = int(os.getenv('SCENE_RENDER_WORKERS', str(min(6, os.cpu_count() or 1))))
+
+# orjson parses the voices listing several times faster than the stdlib;
+# both accept the raw response bytes
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 
 def find_existing_avatar() -> str:
@@ -82,6 +110,18 @@ def get_available_voices_by_gender() -> dict:
     }
 
 
+# Formatting that clean_script_for_tts strips before text is sent to TTS
+_RE_ASTERISK = re.compile(r'\*([^*]+)\*')
+_RE_TRAILING_DOT = re.compile(r'\.\s*$', re.MULTILINE)
+_RE_ELLIPSIS = re.compile(r'\.{3,}')
+_RE_LINE_DOT = re.compile(r'^\.\s*$', re.MULTILINE)
+_RE_BRACKETS = re.compile(r'\[[^\]]*\]')
+_RE_PARENS = re.compile(r'\([^)]*\)')
+_RE_DQUOTE = re.compile(r'"([^"]+)"')
+_RE_SQUOTE = re.compile(r"'([^']+)'")
+_RE_WS = re.compile(r'\s+')
+
+
 def clean_script_for_tts(script_text: str) -> str:
     """
     Clean script text to remove formatting elements that shouldn't be spoken
@@ -93,40 +133,32 @@ def clean_script_for_tts(script_text: str) -> str:
         str: Cleaned script text ready for TTS
     """
     # Remove asterisks used for emphasis (e.g., *years* -> years)
-    script_text = re.sub(r'\*([^*]+)\*', r'\1', script_text)
+    script_text = _RE_ASTERISK.sub(r'\1', script_text)
     
     # Remove standalone periods that are used for emphasis (e.g., "Full stop." -> "Full stop")
-    script_text = re.sub(r'\.\s*$', '', script_text, flags=re.MULTILINE)
+    script_text = _RE_TRAILING_DOT.sub('', script_text)
     
     # Remove ellipses that are used for dramatic pause (e.g., "years..." -> "years")
-    script_text = re.sub(r'\.{3,}', '', script_text)
+    script_text = _RE_ELLIPSIS.sub('', script_text)
     
     # Remove single periods that are used for emphasis (e.g., "Deeply." -> "Deeply")
-    script_text = re.sub(r'^\.\s*$', '', script_text, flags=re.MULTILINE)
+    script_text = _RE_LINE_DOT.sub('', script_text)
     
     # Remove brackets and their contents (e.g., [like this])
-    script_text = re.sub(r'\[[^\]]*\]', '', script_text)
+    script_text = _RE_BRACKETS.sub('', script_text)
     
     # Remove parentheses and their contents (e.g., (like this))
-    script_text = re.sub(r'\([^)]*\)', '', script_text)
+    script_text = _RE_PARENS.sub('', script_text)
     
     # Remove quotes around single words that are used for emphasis (e.g., "man enough" -> man enough)
-    script_text = re.sub(r'"([^"]+)"', r'\1', script_text)
+    script_text = _RE_DQUOTE.sub(r'\1', script_text)
     
     # Remove single quotes around words (e.g., 'man enough' -> man enough)
-    script_text = re.sub(r"'([^']+)'", r'\1', script_text)
-    
-    # Remove multiple spaces and clean up whitespace
-    script_text = re.sub(r'\s+', ' ', script_text)
+    script_text = _RE_SQUOTE.sub(r'\1', script_text)
     
-    # Remove leading/trailing whitespace
-    script_text = script_text.strip()
-    
-    # Remove empty lines
-    lines = [line.strip() for line in script_text.split('\n') if line.strip()]
-    script_text = '\n'.join(lines)
-    
-    return script_text
+    # Collapse all whitespace, newlines included, to single spaces and trim
+    # the ends; this also drops empty lines, since no line breaks remain
+    return _RE_WS.sub(' ', script_text).strip()
 
 
 def create_elevenlabs_video(
@@ -168,23 +200,39 @@ def create_elevenlabs_video(
             selected_voice_id = voice_id
             print(f"🎤 Using provided voice: {selected_voice_id}")
         
-        # Step 1: Generate audio using ElevenLabs
-        print("🎵 Generating audio with ElevenLabs...")
-        cleaned_script = clean_script_for_tts(script)
-        audio_path = generate_elevenlabs_audio(cleaned_script, selected_voice_id, model_id)
-        
-        # Step 2: Create engaging visual scenes
-        print("🎨 Creating engaging visual scenes...")
-        scenes = create_engaging_video_scenes(script, quote, title)
-        
-        # Step 3: Combine audio and multiple scenes into video
-        print("🎬 Creating multi-scene video...")
-        video_path = create_multi_scene_video(audio_path, scenes, output_dir)
-        
-        # Clean up temporary files
-        os.unlink(audio_path)
-        for scene_path in scenes:
-            os.unlink(scene_path)
+        audio_path = None
+        scenes = []
+        try:
+            # Steps 1 and 2 overlap: the ElevenLabs request waits on the network
+            # in a background thread while the scenes are rendered
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                # Step 1: Generate audio using ElevenLabs
+                print("🎵 Generating audio with ElevenLabs...")
+                cleaned_script = clean_script_for_tts(script)
+                audio_future = executor.submit(generate_elevenlabs_audio, cleaned_script, selected_voice_id, model_id)
+                
+                try:
+                    # Step 2: Create engaging visual scenes
+                    print("🎨 Creating engaging visual scenes...")
+                    scenes = create_engaging_video_scenes(script, quote, title)
+                finally:
+                    # Collect the audio even if the scenes failed, so its
+                    # temporary file is cleaned up below
+                    audio_error = audio_future.exception()
+                    if audio_error is None:
+                        audio_path = audio_future.result()
+                if audio_error is not None:
+                    raise audio_error
+            
+            # Step 3: Combine audio and multiple scenes into video
+            print("🎬 Creating multi-scene video...")
+            video_path = create_multi_scene_video(audio_path, scenes, output_dir)
+        finally:
+            # Clean up temporary files
+            if audio_path:
+                os.unlink(audio_path)
+            for scene_path in scenes:
+                os.unlink(scene_path)
         
         print(f"✅ Engaging video created successfully: {video_path}")
         return video_path
@@ -197,6 +245,9 @@ def create_multi_scene_video(audio_path: str, scene_paths: list, output_dir: Pat
     """
     Create a video with multiple scenes that change throughout the duration
     
+    The scenes are fed to a single ffmpeg run through the concat demuxer, each
+    shown for an equal share of the narration.
+    
     Args:
         audio_path (str): Path to audio file
         scene_paths (list): List of scene image paths
@@ -205,14 +256,10 @@ def create_multi_scene_video(audio_path: str, scene_paths: list, output_dir: Pat
     Returns:
         str: Path to generated video
     """
+    concat_path = None
     try:
         # Get audio duration
-        duration_cmd = [
-            'ffprobe', '-v', 'quiet', '-show_entries', 'format=duration',
-            '-of', 'csv=p=0', audio_path
-        ]
-        result = subprocess.run(duration_cmd, capture_output=True, text=True)
-        duration = float(result.stdout.strip())
+        duration = get_audio_duration(audio_path)
         
         # Calculate scene duration
         scene_duration = duration / len(scene_paths)
@@ -221,33 +268,27 @@ def create_multi_scene_video(audio_path: str, scene_paths: list, output_dir: Pat
         output_filename = f"engaging_video_{int(duration)}s.mp4"
         output_path = output_dir / output_filename
         
-        # Create filter complex for scene transitions
-        filter_complex = ""
-        inputs = []
-        
-        for i, scene_path in enumerate(scene_paths):
-            inputs.extend(['-loop', '1', '-t', str(scene_duration), '-i', scene_path])
-        
-        # Create scene transitions with crossfade
-        for i in range(len(scene_paths) - 1):
-            if i == 0:
-                filter_complex += f"[0:v][1:v]xfade=transition=fade:duration=0.5:offset={scene_duration-0.5}[v{i+1}];"
-            else:
-                filter_complex += f"[v{i}][{i+1}:v]xfade=transition=fade:duration=0.5:offset={scene_duration-0.5}[v{i+1}];"
+        # List the scenes with their durations; the demuxer ignores the last
+        # entry's duration, so the last scene is listed once more after it
+        def concat_entry(scene_path):
+            escaped_path = str(Path(scene_path).resolve()).replace("'", "'\\''")
+            return f"file '{escaped_path}'\n"
         
-        # Final output
-        final_video = f"v{len(scene_paths)-1}"
-        filter_complex += f"[{final_video}]scale=720:1280:force_original_aspect_ratio=decrease,pad=720:1280:(ow-iw)/2:(oh-ih)/2[vout]"
+        with tempfile.NamedTemporaryFile('w', delete=False, suffix='.txt') as concat_file:
+            for scene_path in scene_paths:
+                concat_file.write(concat_entry(scene_path))
+                concat_file.write(f"duration {scene_duration:.3f}\n")
+            concat_file.write(concat_entry(scene_paths[-1]))
+            concat_path = concat_file.name
         
         # Create video using ffmpeg
         ffmpeg_cmd = [
             'ffmpeg', '-y',  # Overwrite output file
-            *inputs,  # All scene inputs
+            '-f', 'concat', '-safe', '0', '-i', concat_path,  # All scenes, in order
             '-i', audio_path,  # Audio input
-            '-filter_complex', filter_complex,
-            '-map', '[vout]',  # Video output
-            '-map', f'{len(scene_paths)}:a',  # Audio output
+            '-vf', 'scale=720:1280:force_original_aspect_ratio=decrease,pad=720:1280:(ow-iw)/2:(oh-ih)/2',
             '-c:v', 'libx264', '-tune', 'stillimage',  # Video codec
+            '-threads', '0', '-preset', 'veryfast',  # All cores; still images gain nothing from slower presets
             '-c:a', 'aac',  # Audio codec
             '-b:a', '192k',  # Audio bitrate
             '-pix_fmt', 'yuv420p',  # Pixel format for compatibility
@@ -258,71 +299,48 @@ def create_multi_scene_video(audio_path: str, scene_paths: list, output_dir: Pat
         # Run ffmpeg command
         result = subprocess.run(ffmpeg_cmd, capture_output=True, text=True)
         if result.returncode != 0:
-            print(f"FFmpeg error: {result.stderr}")
-            # Fallback to simple concatenation if complex filter fails
-            return create_simple_multi_scene_video(audio_path, scene_paths, output_dir)
+            raise Exception(f"FFmpeg error: {result.stderr}")
         
         print(f"✅ Multi-scene video created: {output_path}")
         return str(output_path)
         
     except Exception as e:
-        print(f"Complex video creation failed, using simple method: {e}")
-        return create_simple_multi_scene_video(audio_path, scene_paths, output_dir)
+        raise Exception(f"Failed to create multi-scene video: {str(e)}")
+    finally:
+        if concat_path:
+            os.unlink(concat_path)
 
 
-def create_simple_multi_scene_video(audio_path: str, scene_paths: list, output_dir: Path) -> str:
-    """
-    Create a simple multi-scene video using basic concatenation
-    
-    Args:
-        audio_path (str): Path to audio file
-        scene_paths (list): List of scene image paths
-        output_dir (Path): Output directory
-        
-    Returns:
-        str: Path to generated video
-    """
+def _write_cached_audio(audio_path: str, cache_path: Path) -> None:
     try:
-        # Get audio duration
-        duration_cmd = [
-            'ffprobe', '-v', 'quiet', '-show_entries', 'format=duration',
-            '-of', 'csv=p=0', audio_path
-        ]
-        result = subprocess.run(duration_cmd, capture_output=True, text=True)
-        duration = float(result.stdout.strip())
-        
-        # Calculate scene duration
-        scene_duration = duration / len(scene_paths)
-        
-        # Generate output filename
-        output_filename = f"engaging_video_{int(duration)}s.mp4"
-        output_path = output_dir / output_filename
-        
-        # Create video using the first scene for the full duration
-        # This is a fallback method
-        ffmpeg_cmd = [
-            'ffmpeg', '-y',  # Overwrite output file
-            '-loop', '1', '-i', scene_paths[0],  # Use first scene
-            '-i', audio_path,  # Input audio
-            '-c:v', 'libx264', '-tune', 'stillimage',  # Video codec
-            '-c:a', 'aac',  # Audio codec
-            '-b:a', '192k',  # Audio bitrate
-            '-pix_fmt', 'yuv420p',  # Pixel format for compatibility
-            '-shortest',  # End when shortest input ends
-            '-t', str(duration),  # Duration
-            str(output_path)
-        ]
-        
-        # Run ffmpeg command
-        result = subprocess.run(ffmpeg_cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            raise Exception(f"FFmpeg error: {result.stderr}")
-        
-        print(f"✅ Simple multi-scene video created: {output_path}")
-        return str(output_path)
-        
-    except Exception as e:
-        raise Exception(f"Failed to create simple multi-scene video: {str(e)}")
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Copy then rename so a concurrent reader never sees a partial file
+        with tempfile.NamedTemporaryFile(dir=cache_path.parent, suffix='.tmp', delete=False) as tmp_file:
+            tmp_path = tmp_file.name
+        shutil.copyfile(audio_path, tmp_path)
+        os.replace(tmp_path, cache_path)
+        _evict_cached_audio(keep=cache_path)
+    except OSError as e:
+        print(f"Warning: Could not write TTS cache: {e}")
+
+
+def _evict_cached_audio(keep: Path) -> None:
+    # Least recently used first; cache hits refresh a file's mtime
+    cached = []
+    for path in TTS_CACHE_DIR.glob("*.mp3"):
+        try:
+            cached.append((path.stat(), path))
+        except OSError:
+            continue  # Evicted by another process meanwhile
+    cached.sort(key=lambda item: item[0].st_mtime)
+    total = sum(stat.st_size for stat, _ in cached)
+    for stat, path in cached:
+        if total <= TTS_CACHE_MAX_BYTES:
+            break
+        if path == keep:
+            continue
+        total -= stat.st_size
+        path.unlink(missing_ok=True)
 
 
 def generate_elevenlabs_audio(script: str, voice_id: str, model_id: str) -> str:
@@ -338,13 +356,15 @@ def generate_elevenlabs_audio(script: str, voice_id: str, model_id: str) -> str:
         str: Path to generated audio file
     """
     try:
+        from tools.voice_tool import ELEVENLABS_API_BASE, get_elevenlabs_session
+        
         # Get API key from environment
         api_key = os.getenv('ELEVENLABS_API_KEY')
         if not api_key:
             raise Exception("ELEVENLABS_API_KEY not found in environment variables")
         
         # ElevenLabs API endpoint
-        url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
+        url = f"{ELEVENLABS_API_BASE}/v1/text-to-speech/{voice_id}"
         
         headers = {
             "Accept": "audio/mpeg",
@@ -363,16 +383,36 @@ def generate_elevenlabs_audio(script: str, voice_id: str, model_id: str) -> str:
             }
         }
         
-        # Make API request
-        response = requests.post(url, json=data, headers=headers)
-        
-        if response.status_code != 200:
-            raise Exception(f"ElevenLabs API error: {response.status_code} - {response.text}")
+        # Reuse audio already synthesized for the same voice, model, settings
+        # and text; callers delete the returned file, so hand out a copy
+        cache_path = TTS_CACHE_DIR / f"{bytes_digest(json.dumps([voice_id, data], sort_keys=True).encode('utf-8'))}.mp3"
+        if cache_path.exists():
+            with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as tmp_file:
+                audio_path = tmp_file.name
+            try:
+                shutil.copyfile(cache_path, audio_path)
+                # utime rather than touch, which would recreate an evicted
+                # entry as an empty file
+                os.utime(cache_path)
+            except FileNotFoundError:
+                # Evicted by a concurrent call in the meantime; treat as a miss
+                os.unlink(audio_path)
+            else:
+                print(f"✅ Using cached audio: {audio_path}")
+                return audio_path
+        
+        # Make API request over the shared keep-alive session, streaming the
+        # audio to a temporary file as it arrives instead of buffering it
+        with get_elevenlabs_session().post(url, json=data, headers=headers, stream=True) as response:
+            if response.status_code != 200:
+                raise Exception(f"ElevenLabs API error: {response.status_code} - {response.text}")
+            
+            with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as tmp_file:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    tmp_file.write(chunk)
+                audio_path = tmp_file.name
         
-        # Save audio to temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as tmp_file:
-            tmp_file.write(response.content)
-            audio_path = tmp_file.name
+        _write_cached_audio(audio_path, cache_path)
         
         print(f"✅ Audio generated: {audio_path}")
         return audio_path
@@ -381,7 +421,87 @@ def generate_elevenlabs_audio(script: str, voice_id: str, model_id: str) -> str:
         raise Exception(f"Failed to generate ElevenLabs audio: {str(e)}")
 
 
-def create_video_image(
+# Arial as installed on macOS, then wherever FreeType can find it
+_FONT_CANDIDATES = ("/System/Library/Fonts/Arial.ttf", "Arial.ttf")
+
+
+@lru_cache(maxsize=32)
+def _load_font(size: int):
+    """
+    Load the first available candidate font at the given size, falling back
+    to PIL's default font
+    
+    Fonts are cached per size, so each TrueType file is parsed once per process
+    rather than on every image.
+    
+    Args:
+        size (int): Font size in points
+        
+    Returns:
+        ImageFont: The loaded font
+    """
+    for font_path in _FONT_CANDIDATES:
+        try:
+            return ImageFont.truetype(font_path, size)
+        except OSError:
+            continue
+    return _load_default_font()
+
+
+@lru_cache(maxsize=1)
+def _load_default_font():
+    # Recent Pillow builds its default font from embedded TrueType data on
+    # every load_default() call, so load it once
+    return ImageFont.load_default()
+
+
+def _vertical_gradient(width: int, height: int, start_color: tuple, delta: tuple) -> Image.Image:
+    """
+    Build an image whose rows fade from start_color towards start_color + delta
+    
+    Each row y gets start + int(delta * y / height) per channel, capped at 255,
+    computed for all rows at once with NumPy instead of drawing line by line.
+    
+    Args:
+        width (int): Image width
+        height (int): Image height
+        start_color (tuple): (r, g, b) of the top row
+        delta (tuple): (r, g, b) change across the full height
+        
+    Returns:
+        Image.Image: RGB gradient image
+    """
+    y = np.arange(height, dtype=np.int64)[:, None]
+    rows = np.asarray(start_color, dtype=np.int64) + (y * np.asarray(delta, dtype=np.int64)) // height
+    rows = np.clip(rows, 0, 255).astype(np.uint8)
+    return Image.fromarray(np.ascontiguousarray(np.broadcast_to(rows[:, None, :], (height, width, 3))), 'RGB')
+
+
+@lru_cache(maxsize=8)
+def _video_image_background(background_color: str, title: str, text_color: str, width: int, height: int) -> Image.Image:
+    """
+    Render the static layers of a video image: the gradient background and
+    the shadowed title
+    
+    Cached so a series of videos sharing a background and title renders them
+    once; callers must draw on a copy, never on the returned image.
+    """
+    # Create image with a subtle top-to-bottom gradient background
+    base_color = tuple(int(background_color[i:i + 2], 16) for i in (1, 3, 5))
+    img = _vertical_gradient(width, height, base_color, (20, 20, 20))
+    draw = ImageDraw.Draw(img)
+    title_font = _load_font(72)
+    
+    # Draw title with shadow effect
+    title_y = 80
+    # Shadow
+    draw.text((width//2 + 2, title_y + 2), title, font=title_font, fill="#000000", anchor="mm")
+    # Main text
+    draw.text((width//2, title_y), title, font=title_font, fill=text_color, anchor="mm")
+    return img
+
+
+def render_video_image(
     script: str,
     quote: str,
     title: str,
@@ -389,9 +509,9 @@ def create_video_image(
     text_color: str,
     width: int = 720,
     height: int = 1280
-) -> str:
+) -> Image.Image:
     """
-    Create a dynamic visual image for the video based on script content
+    Render a dynamic visual image for the video based on script content
     
     Args:
         script (str): Script text
@@ -403,59 +523,27 @@ def create_video_image(
         height (int): Image height
         
     Returns:
-        str: Path to generated image
+        Image.Image: The rendered image
     """
     try:
-        # Create image with gradient background
-        img = Image.new('RGB', (width, height), background_color)
+        # Start from a copy of the shared gradient + title layer
+        img = _video_image_background(background_color, title, text_color, width, height).copy()
         draw = ImageDraw.Draw(img)
         
-        # Create gradient background
-        for y in range(height):
-            # Create a subtle gradient from top to bottom
-            ratio = y / height
-            r = int(background_color[1:3], 16) + int(20 * ratio)
-            g = int(background_color[3:5], 16) + int(20 * ratio)
-            b = int(background_color[5:7], 16) + int(20 * ratio)
-            r, g, b = min(255, r), min(255, g), min(255, b)
-            color = (r, g, b)
-            draw.line([(0, y), (width, y)], fill=color)
-        
         # Try to use a system font, fallback to default
-        try:
-            title_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 72)
-            script_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 32)
-            quote_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 42)
-        except:
-            try:
-                title_font = ImageFont.truetype("Arial.ttf", 72)
-                script_font = ImageFont.truetype("Arial.ttf", 32)
-                quote_font = ImageFont.truetype("Arial.ttf", 42)
-            except:
-                title_font = ImageFont.load_default()
-                script_font = ImageFont.load_default()
-                quote_font = ImageFont.load_default()
-        
-        # Draw title with shadow effect
-        title_y = 80
-        # Shadow
-        draw.text((width//2 + 2, title_y + 2), title, font=title_font, fill="#000000", anchor="mm")
-        # Main text
-        draw.text((width//2, title_y), title, font=title_font, fill=text_color, anchor="mm")
+        script_font = _load_font(32)
+        quote_font = _load_font(42)
         
         # Extract key phrases from script for dynamic display
         script_words = script.split()
         key_phrases = []
         
         # Find important phrases (words that appear multiple times or are capitalized)
-        word_count = {}
-        for word in script_words:
-            clean_word = word.strip('.,!?').lower()
-            if len(clean_word) > 3:
-                word_count[clean_word] = word_count.get(clean_word, 0) + 1
+        clean_words = (word.strip('.,!?').lower() for word in script_words)
+        word_count = Counter(word for word in clean_words if len(word) > 3)
         
         # Get most frequent words
-        frequent_words = sorted(word_count.items(), key=lambda x: x[1], reverse=True)[:5]
+        frequent_words = word_count.most_common(5)
         
         # Draw key phrases in a dynamic layout
         phrase_y = 200
@@ -500,9 +588,43 @@ def create_video_image(
                 y = 100 + (i % 2) * 20
                 draw.text((x, y), "★", font=script_font, fill="#FFD700")
         
-        # Save image
+        return img
+        
+    except Exception as e:
+        raise Exception(f"Failed to render video image: {str(e)}")
+
+
+def create_video_image(
+    script: str,
+    quote: str,
+    title: str,
+    background_color: str,
+    text_color: str,
+    width: int = 720,
+    height: int = 1280
+) -> str:
+    """
+    Create a dynamic visual image for the video based on script content
+    
+    Args:
+        script (str): Script text
+        quote (str): Key quote
+        title (str): Video title
+        background_color (str): Background color
+        text_color (str): Text color
+        width (int): Image width
+        height (int): Image height
+        
+    Returns:
+        str: Path to generated image
+    """
+    try:
+        img = render_video_image(script, quote, title, background_color, text_color, width, height)
+        
+        # Save image; ffmpeg re-encodes it straight away, so favour a fast
+        # zlib level over a small file
         with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as tmp_file:
-            img.save(tmp_file.name, 'PNG')
+            img.save(tmp_file, 'PNG', compress_level=1)
             image_path = tmp_file.name
         
         print(f"✅ Dynamic image created: {image_path}")
@@ -512,6 +634,12 @@ def create_video_image(
         raise Exception(f"Failed to create video image: {str(e)}")
 
 
+@lru_cache(maxsize=1)
+def _scene_executor() -> ThreadPoolExecutor:
+    # One long-lived pool for every video rather than one per call
+    return ThreadPoolExecutor(max_workers=SCENE_RENDER_WORKERS, thread_name_prefix="scene-render")
+
+
 def create_engaging_video_scenes(
     script: str,
     quote: str,
@@ -533,27 +661,49 @@ def create_engaging_video_scenes(
         list: List of image paths for different scenes
     """
     try:
-        scenes = []
+        scene_jobs = []
         
         # Scene 1: Title/Hook Scene
-        scenes.append(create_title_scene(title, width, height))
+        scene_jobs.append((create_title_scene, title))
         
         # Scene 2: Content-Aware Scene (adapts to script theme)
-        scenes.append(create_content_aware_scene(script, width, height))
+        scene_jobs.append((create_content_aware_scene, script))
         
         # Scene 3: Key Points Scene
-        scenes.append(create_key_points_scene(script, width, height))
+        scene_jobs.append((create_key_points_scene, script))
         
         # Scene 4: Main Content Scene
-        scenes.append(create_main_content_scene(script, width, height))
+        scene_jobs.append((create_main_content_scene, script))
         
         # Scene 5: Quote/Highlight Scene
         if quote:
-            scenes.append(create_quote_scene(quote, width, height))
+            scene_jobs.append((create_quote_scene, quote))
         
         # Scene 6: Call-to-Action Scene
-        scenes.append(create_cta_scene(script, width, height))
+        scene_jobs.append((create_cta_scene, script))
         
+        if SCENE_RENDER_WORKERS <= 1:
+            scenes = []
+            try:
+                for render, text in scene_jobs:
+                    scenes.append(render(text, width, height))
+            except Exception:
+                # Don't leave the scenes that did render behind
+                for scene_path in scenes:
+                    os.unlink(scene_path)
+                raise
+            return scenes
+        
+        # Scenes are independent; NumPy and PIL's encoders release the GIL,
+        # and sharing the process keeps the font and background caches warm
+        futures = [_scene_executor().submit(render, text, width, height) for render, text in scene_jobs]
+        wait(futures)
+        scenes = [future.result() for future in futures if future.exception() is None]
+        if len(scenes) < len(futures):
+            # Don't leave the scenes that did render behind
+            for scene_path in scenes:
+                os.unlink(scene_path)
+            raise next(future.exception() for future in futures if future.exception() is not None)
         return scenes
         
     except Exception as e:
@@ -564,18 +714,9 @@ def create_title_scene(title: str, width: int, height: int) -> str:
     """Create an engaging title scene with animations"""
     try:
         # Create vibrant gradient background
-        img = Image.new('RGB', (width, height), "#1a1a2e")
-        draw = ImageDraw.Draw(img)
-        
         # Create animated gradient background
-        for y in range(height):
-            ratio = y / height
-            r = int(26 + 50 * ratio)  # 1a to 4a
-            g = int(26 + 100 * ratio)  # 1a to aa
-            b = int(46 + 80 * ratio)   # 2e to 8e
-            r, g, b = min(255, r), min(255, g), min(255, b)
-            color = (r, g, b)
-            draw.line([(0, y), (width, y)], fill=color)
+        img = _vertical_gradient(width, height, (26, 26, 46), (50, 100, 80))
+        draw = ImageDraw.Draw(img)
         
         # Add animated elements
         for i in range(20):
@@ -586,16 +727,8 @@ def create_title_scene(title: str, width: int, height: int) -> str:
             draw.ellipse([x-size//2, y-size//2, x+size//2, y+size//2], fill=color)
         
         # Try to use a system font
-        try:
-            title_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 80)
-            subtitle_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 36)
-        except:
-            try:
-                title_font = ImageFont.truetype("Arial.ttf", 80)
-                subtitle_font = ImageFont.truetype("Arial.ttf", 36)
-            except:
-                title_font = ImageFont.load_default()
-                subtitle_font = ImageFont.load_default()
+        title_font = _load_font(80)
+        subtitle_font = _load_font(36)
         
         # Draw title with multiple effects
         title_y = height // 2 - 60
@@ -613,42 +746,50 @@ def create_title_scene(title: str, width: int, height: int) -> str:
         
         # Save scene
         with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as tmp_file:
-            img.save(tmp_file.name, 'PNG')
+            img.save(tmp_file, 'PNG', compress_level=1)
             return tmp_file.name
             
     except Exception as e:
         raise Exception(f"Failed to create title scene: {str(e)}")
 
 
+@lru_cache(maxsize=4)
+def _key_points_background(width: int, height: int) -> Image.Image:
+    """
+    Render the key points scene's tiled background: #0f0f23 with a #16213e
+    tile on every 40px cell whose column + row is a multiple of 4
+    
+    Built with NumPy in one pass and cached; callers must draw on a copy.
+    """
+    x = np.arange(width)
+    y = np.arange(height)
+    cell_sum = (x // 40)[None, :] + (y // 40)[:, None]
+    # Tiles were drawn on cells with an even column + row as inclusive 41px
+    # rectangles, so each also covers the first pixel row/column of the odd
+    # cells below and to its right
+    on_edge = ((y % 40 == 0) & (y > 0))[:, None] | ((x % 40 == 0) & (x > 0))[None, :]
+    drawn_sum = np.where(cell_sum % 2 == 0, cell_sum, np.where(on_edge, cell_sum - 1, -1))
+    
+    pixels = np.empty((height, width, 3), dtype=np.uint8)
+    pixels[:] = (15, 15, 35)
+    pixels[(drawn_sum >= 0) & (drawn_sum % 4 == 0)] = (22, 33, 62)
+    return Image.fromarray(pixels, 'RGB')
+
+
 def create_key_points_scene(script: str, width: int, height: int) -> str:
     """Create a scene highlighting key points from the script"""
     try:
-        # Create dynamic background
-        img = Image.new('RGB', (width, height), "#0f0f23")
+        # Create dynamic background with its tiled pattern
+        img = _key_points_background(width, height).copy()
         draw = ImageDraw.Draw(img)
         
-        # Create animated background pattern
-        for i in range(0, width, 40):
-            for j in range(0, height, 40):
-                if (i + j) % 80 == 0:
-                    color = "#16213e" if (i + j) % 160 == 0 else "#0f0f23"
-                    draw.rectangle([i, j, i+40, j+40], fill=color)
-        
         # Extract key words from script
         words = script.split()
         key_words = [word.strip('.,!?').upper() for word in words if len(word) > 4][:6]
         
         # Try to use a system font
-        try:
-            word_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 48)
-            label_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 28)
-        except:
-            try:
-                word_font = ImageFont.truetype("Arial.ttf", 48)
-                label_font = ImageFont.truetype("Arial.ttf", 28)
-            except:
-                word_font = ImageFont.load_default()
-                label_font = ImageFont.load_default()
+        word_font = _load_font(48)
+        label_font = _load_font(28)
         
         # Draw key words in dynamic layout
         colors = ["#FF6B6B", "#4ECDC4", "#45B7D1", "#96CEB4", "#FFEAA7", "#DDA0DD"]
@@ -676,7 +817,7 @@ def create_key_points_scene(script: str, width: int, height: int) -> str:
         
         # Save scene
         with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as tmp_file:
-            img.save(tmp_file.name, 'PNG')
+            img.save(tmp_file, 'PNG', compress_level=1)
             return tmp_file.name
             
     except Exception as e:
@@ -687,30 +828,13 @@ def create_main_content_scene(script: str, width: int, height: int) -> str:
     """Create the main content scene with script text"""
     try:
         # Create engaging background
-        img = Image.new('RGB', (width, height), "#2c3e50")
-        draw = ImageDraw.Draw(img)
-        
         # Create animated gradient
-        for y in range(height):
-            ratio = y / height
-            r = int(44 + 50 * ratio)  # 2c to 5c
-            g = int(62 + 30 * ratio)  # 3e to 4e
-            b = int(80 + 40 * ratio)  # 50 to 70
-            r, g, b = min(255, r), min(255, g), min(255, b)
-            color = (r, g, b)
-            draw.line([(0, y), (width, y)], fill=color)
+        img = _vertical_gradient(width, height, (44, 62, 80), (50, 30, 40))
+        draw = ImageDraw.Draw(img)
         
         # Try to use a system font
-        try:
-            script_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 36)
-            highlight_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 42)
-        except:
-            try:
-                script_font = ImageFont.truetype("Arial.ttf", 36)
-                highlight_font = ImageFont.truetype("Arial.ttf", 42)
-            except:
-                script_font = ImageFont.load_default()
-                highlight_font = ImageFont.load_default()
+        script_font = _load_font(36)
+        highlight_font = _load_font(42)
         
         # Format script text
         script_lines = textwrap.wrap(script, width=25)
@@ -741,41 +865,45 @@ def create_main_content_scene(script: str, width: int, height: int) -> str:
         
         # Save scene
         with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as tmp_file:
-            img.save(tmp_file.name, 'PNG')
+            img.save(tmp_file, 'PNG', compress_level=1)
             return tmp_file.name
             
     except Exception as e:
         raise Exception(f"Failed to create main content scene: {str(e)}")
 
 
+@lru_cache(maxsize=4)
+def _quote_background(width: int, height: int) -> Image.Image:
+    """
+    Render the quote scene's background: gold at the centre fading linearly
+    to #1a1a1a at half the larger dimension
+    
+    Computed as one NumPy distance field and cached; callers must draw on a copy.
+    """
+    center_x, center_y = width // 2, height // 2
+    max_radius = max(width, height) // 2
+    
+    dy = np.arange(height, dtype=np.float32)[:, None] - center_y
+    dx = np.arange(width, dtype=np.float32)[None, :] - center_x
+    distance = np.sqrt(dx * dx + dy * dy)
+    glow = np.clip(1 - distance / max_radius, 0, 1)[..., None]
+    
+    gold = np.array([255, 215, 0], dtype=np.float32)
+    background = np.array([26, 26, 26], dtype=np.float32)
+    pixels = (glow * gold + (1 - glow) * background).astype(np.uint8)
+    return Image.fromarray(pixels, 'RGB')
+
+
 def create_quote_scene(quote: str, width: int, height: int) -> str:
     """Create a dramatic quote scene"""
     try:
-        # Create dramatic background
-        img = Image.new('RGB', (width, height), "#1a1a1a")
+        # Create dramatic background with a radial gold glow
+        img = _quote_background(width, height).copy()
         draw = ImageDraw.Draw(img)
         
-        # Create radial gradient effect
-        center_x, center_y = width // 2, height // 2
-        max_radius = max(width, height) // 2
-        
-        for radius in range(max_radius, 0, -10):
-            alpha = int(255 * (1 - radius / max_radius))
-            color = (255, 215, 0, alpha)  # Gold with transparency
-            draw.ellipse([center_x-radius, center_y-radius, center_x+radius, center_y+radius], 
-                        fill=color)
-        
         # Try to use a system font
-        try:
-            quote_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 48)
-            attribution_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 32)
-        except:
-            try:
-                quote_font = ImageFont.truetype("Arial.ttf", 48)
-                attribution_font = ImageFont.truetype("Arial.ttf", 32)
-            except:
-                quote_font = ImageFont.load_default()
-                attribution_font = ImageFont.load_default()
+        quote_font = _load_font(48)
+        attribution_font = _load_font(32)
         
         # Format quote
         quote_lines = textwrap.wrap(quote, width=20)
@@ -797,7 +925,7 @@ def create_quote_scene(quote: str, width: int, height: int) -> str:
         
         # Save scene
         with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as tmp_file:
-            img.save(tmp_file.name, 'PNG')
+            img.save(tmp_file, 'PNG', compress_level=1)
             return tmp_file.name
             
     except Exception as e:
@@ -819,16 +947,8 @@ def create_cta_scene(script: str, width: int, height: int) -> str:
                     draw.rectangle([i, j, i+60, j+60], fill=color)
         
         # Try to use a system font
-        try:
-            cta_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 64)
-            action_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 36)
-        except:
-            try:
-                cta_font = ImageFont.truetype("Arial.ttf", 64)
-                action_font = ImageFont.truetype("Arial.ttf", 36)
-            except:
-                cta_font = ImageFont.load_default()
-                action_font = ImageFont.load_default()
+        cta_font = _load_font(64)
+        action_font = _load_font(36)
         
         # Draw call-to-action
         cta_text = "DON'T MISS OUT!"
@@ -862,7 +982,7 @@ def create_cta_scene(script: str, width: int, height: int) -> str:
         
         # Save scene
         with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as tmp_file:
-            img.save(tmp_file.name, 'PNG')
+            img.save(tmp_file, 'PNG', compress_level=1)
             return tmp_file.name
             
     except Exception as e:
@@ -962,37 +1082,31 @@ def create_content_aware_scene(script: str, width: int, height: int) -> str:
                 y = (i % 5) * height // 5 + 50
                 size = 20 + (i % 3) * 10
                 draw.ellipse([x-size//2, y-size//2, x+size//2, y+size//2], fill=accent_color)
-                draw.text((x, y), "✓", font=ImageFont.load_default(), fill="#FFFFFF", anchor="mm")
+                draw.text((x, y), "✓", font=_load_default_font(), fill="#FFFFFF", anchor="mm")
         
         elif theme == "money":
             # Money theme - dollar signs and coins
             for i in range(20):
                 x = (i * width // 20) + (i % 4) * 15
                 y = (i % 6) * height // 6 + 30
-                draw.text((x, y), "$", font=ImageFont.load_default(), fill=accent_color)
+                draw.text((x, y), "$", font=_load_default_font(), fill=accent_color)
         
         elif theme == "love":
             # Love theme - hearts
             for i in range(12):
                 x = (i * width // 12) + (i % 2) * 30
                 y = (i % 4) * height // 4 + 40
-                draw.text((x, y), "♥", font=ImageFont.load_default(), fill=accent_color)
+                draw.text((x, y), "♥", font=_load_default_font(), fill=accent_color)
         
         elif theme == "fear":
             # Fear theme - warning symbols
             for i in range(10):
                 x = (i * width // 10) + (i % 3) * 25
                 y = (i % 5) * height // 5 + 60
-                draw.text((x, y), "⚠", font=ImageFont.load_default(), fill=accent_color)
+                draw.text((x, y), "⚠", font=_load_default_font(), fill=accent_color)
         
         # Add script text with theme-appropriate styling
-        try:
-            script_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 36)
-        except:
-            try:
-                script_font = ImageFont.truetype("Arial.ttf", 36)
-            except:
-                script_font = ImageFont.load_default()
+        script_font = _load_font(36)
         
         # Format and display script
         script_lines = textwrap.wrap(script, width=25)
@@ -1014,20 +1128,53 @@ def create_content_aware_scene(script: str, width: int, height: int) -> str:
         
         # Save scene
         with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as tmp_file:
-            img.save(tmp_file.name, 'PNG')
+            img.save(tmp_file, 'PNG', compress_level=1)
             return tmp_file.name
             
     except Exception as e:
         raise Exception(f"Failed to create content-aware scene: {str(e)}")
 
 
-def combine_audio_and_visuals(audio_path: str, image_path: str, output_dir: Path) -> str:
+def get_audio_duration(audio_path: str) -> float:
+    """
+    Get the duration of an audio file in seconds
+    
+    Reads it from the file's headers with mutagen when it is installed, which
+    avoids spawning ffprobe; falls back to ffprobe otherwise or for formats
+    mutagen can't parse.
+    
+    Args:
+        audio_path (str): Path to audio file
+        
+    Returns:
+        float: Duration in seconds
+    """
+    if MutagenFile is not None:
+        try:
+            audio = MutagenFile(audio_path)
+            if audio is not None and audio.info.length:
+                return float(audio.info.length)
+        except Exception as e:
+            print(f"Warning: Could not read duration with mutagen, using ffprobe: {e}")
+    
+    duration_cmd = [
+        'ffprobe', '-v', 'quiet', '-show_entries', 'format=duration',
+        '-of', 'csv=p=0', audio_path
+    ]
+    result = subprocess.run(duration_cmd, capture_output=True, text=True)
+    return float(result.stdout.strip())
+
+
+def combine_audio_and_visuals(audio_path: str, image: Union[str, Image.Image], output_dir: Path) -> str:
     """
     Combine audio and visual elements into a video using ffmpeg
     
+    An in-memory image (e.g. from render_video_image) is piped to ffmpeg's
+    stdin instead of being written to a temporary file first.
+    
     Args:
         audio_path (str): Path to audio file
-        image_path (str): Path to image file
+        image (Union[str, Image.Image]): Path to image file, or the image itself
         output_dir (Path): Output directory
         
     Returns:
@@ -1035,35 +1182,48 @@ def combine_audio_and_visuals(audio_path: str, image_path: str, output_dir: Path
     """
     try:
         # Get audio duration
-        duration_cmd = [
-            'ffprobe', '-v', 'quiet', '-show_entries', 'format=duration',
-            '-of', 'csv=p=0', audio_path
-        ]
-        result = subprocess.run(duration_cmd, capture_output=True, text=True)
-        duration = float(result.stdout.strip())
+        duration = get_audio_duration(audio_path)
         
         # Generate output filename
         output_filename = f"elevenlabs_video_{int(duration)}s.mp4"
         output_path = output_dir / output_filename
         
+        if isinstance(image, Image.Image):
+            buffer = io.BytesIO()
+            image.save(buffer, 'PNG', compress_level=1)
+            image_bytes = buffer.getvalue()
+            # A piped image can't be re-read by -loop, so the loop filter
+            # repeats its single frame instead
+            image_input = ['-f', 'image2pipe', '-c:v', 'png', '-i', 'pipe:0']
+            loop_filter = ['-vf', 'loop=loop=-1:size=1']
+        else:
+            image_bytes = None
+            image_input = ['-loop', '1', '-i', image]  # Input image (loop for duration)
+            loop_filter = []
+        
         # Create video using ffmpeg
         ffmpeg_cmd = [
             'ffmpeg', '-y',  # Overwrite output file
-            '-loop', '1', '-i', image_path,  # Input image (loop for duration)
+            *image_input,
             '-i', audio_path,  # Input audio
+            *loop_filter,
             '-c:v', 'libx264', '-tune', 'stillimage',  # Video codec
+            # Every frame is the same image, so the slower presets' motion
+            # search buys nothing; x264's scene-cut analysis is skipped too
+            '-threads', '0', '-preset', 'veryfast', '-x264-params', 'scenecut=0',
             '-c:a', 'aac',  # Audio codec
             '-b:a', '192k',  # Audio bitrate
             '-pix_fmt', 'yuv420p',  # Pixel format for compatibility
+            '-movflags', '+faststart',  # Index up front for progressive playback
             '-shortest',  # End when shortest input ends
             '-t', str(duration),  # Duration
             str(output_path)
         ]
         
         # Run ffmpeg command
-        result = subprocess.run(ffmpeg_cmd, capture_output=True, text=True)
+        result = subprocess.run(ffmpeg_cmd, input=image_bytes, capture_output=True)
         if result.returncode != 0:
-            raise Exception(f"FFmpeg error: {result.stderr}")
+            raise Exception(f"FFmpeg error: {result.stderr.decode(errors='replace')}")
         
         print(f"✅ Video created: {output_path}")
         return str(output_path)
@@ -1119,22 +1279,24 @@ def get_available_voices() -> list[Dict[str, Any]]:
         list: List of available voices
     """
     try:
+        from tools.voice_tool import ELEVENLABS_API_BASE, get_elevenlabs_session
+        
         api_key = os.getenv('ELEVENLABS_API_KEY')
         if not api_key:
             raise Exception("ELEVENLABS_API_KEY not found in environment variables")
         
-        url = "https://api.elevenlabs.io/v1/voices"
+        url = f"{ELEVENLABS_API_BASE}/v1/voices"
         headers = {
             "Accept": "application/json",
             "xi-api-key": api_key
         }
         
-        response = requests.get(url, headers=headers)
+        response = get_elevenlabs_session().get(url, headers=headers)
         
         if response.status_code != 200:
             raise Exception(f"ElevenLabs API error: {response.status_code} - {response.text}")
         
-        voices = response.json().get('voices', [])
+        voices = _json_loads(response.content).get('voices', [])
         return voices
         
     except Exception as e:
@@ -1293,18 +1455,9 @@ def create_professional_narrator_scene(script: str, title: str) -> str:
     """
     try:
         # Create a professional, clean design
-        img = Image.new('RGB', (720, 1280), "#0f0f23")
-        draw = ImageDraw.Draw(img)
-        
         # Create elegant gradient background
-        for y in range(1280):
-            ratio = y / 1280
-            r = int(15 + 30 * ratio)  # 0f to 2d
-            g = int(15 + 50 * ratio)  # 0f to 3d
-            b = int(35 + 40 * ratio)  # 23 to 4b
-            r, g, b = min(255, r), min(255, g), min(255, b)
-            color = (r, g, b)
-            draw.line([(0, y), (720, y)], fill=color)
+        img = _vertical_gradient(720, 1280, (15, 15, 35), (30, 50, 40))
+        draw = ImageDraw.Draw(img)
         
         # Draw professional narrator figure
         person_x = 360  # Center of image
@@ -1345,14 +1498,9 @@ def create_professional_narrator_scene(script: str, title: str) -> str:
                       fill="#FFD700", outline="#FFFFFF", width=2)
         
         # Add professional title
-        try:
-            title_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 52)
-            script_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 26)
-            narrator_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 32)
-        except:
-            title_font = ImageFont.load_default()
-            script_font = ImageFont.load_default()
-            narrator_font = ImageFont.load_default()
+        title_font = _load_font(52)
+        script_font = _load_font(26)
+        narrator_font = _load_font(32)
         
         # Title at top
         draw.text((360, 60), title, font=title_font, fill="#FFD700", anchor="mm")
@@ -1378,7 +1526,7 @@ def create_professional_narrator_scene(script: str, title: str) -> str:
         
         # Save scene
         with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as tmp_file:
-            img.save(tmp_file.name, 'PNG')
+            img.save(tmp_file, 'PNG', compress_level=1)
             return tmp_file.name
             
     except Exception as e:
@@ -1399,12 +1547,7 @@ def create_professional_video(audio_path: str, narrator_scene_path: str, output_
     """
     try:
         # Get audio duration
-        duration_cmd = [
-            'ffprobe', '-v', 'quiet', '-show_entries', 'format=duration',
-            '-of', 'csv=p=0', audio_path
-        ]
-        result = subprocess.run(duration_cmd, capture_output=True, text=True)
-        duration = float(result.stdout.strip())
+        duration = get_audio_duration(audio_path)
         
         # Generate output filename
         output_filename = f"professional_video_{int(duration)}s.mp4"
@@ -1416,6 +1559,7 @@ def create_professional_video(audio_path: str, narrator_scene_path: str, output_
             '-loop', '1', '-i', narrator_scene_path,  # Input image (loop for duration)
             '-i', audio_path,  # Input audio
             '-c:v', 'libx264', '-tune', 'stillimage',  # Video codec
+            '-threads', '0', '-preset', 'veryfast',  # All cores; still images gain nothing from slower presets
             '-c:a', 'aac',  # Audio codec
             '-b:a', '256k',  # Higher audio bitrate for better quality
             '-pix_fmt', 'yuv420p',  # Pixel format for compatibility
@@ -1457,18 +1601,9 @@ def create_scene_with_existing_avatar(avatar_path: str, script: str, title: str)
             avatar_img = avatar_img.convert('RGB')
         
         # Create the scene background
-        img = Image.new('RGB', (720, 1280), "#1a1a2e")
-        draw = ImageDraw.Draw(img)
-        
         # Create gradient background
-        for y in range(1280):
-            ratio = y / 1280
-            r = int(26 + 50 * ratio)
-            g = int(26 + 100 * ratio)
-            b = int(46 + 80 * ratio)
-            r, g, b = min(255, r), min(255, g), min(255, b)
-            color = (r, g, b)
-            draw.line([(0, y), (720, y)], fill=color)
+        img = _vertical_gradient(720, 1280, (26, 26, 46), (50, 100, 80))
+        draw = ImageDraw.Draw(img)
         
         # Resize avatar to fit nicely in the scene
         avatar_size = 300
@@ -1482,12 +1617,8 @@ def create_scene_with_existing_avatar(avatar_path: str, script: str, title: str)
         img.paste(avatar_img, (avatar_x, avatar_y))
         
         # Add title
-        try:
-            title_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 48)
-            script_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 24)
-        except:
-            title_font = ImageFont.load_default()
-            script_font = ImageFont.load_default()
+        title_font = _load_font(48)
+        script_font = _load_font(24)
         
         # Title at top
         title_bbox = draw.textbbox((0, 0), title, font=title_font)
@@ -1509,7 +1640,7 @@ def create_scene_with_existing_avatar(avatar_path: str, script: str, title: str)
         import time
         timestamp = int(time.time())
         scene_path = f"narration_scene_with_avatar_{timestamp}.png"
-        img.save(scene_path)
+        img.save(scene_path, 'PNG', compress_level=1)
         
         print(f"✅ Created narration scene with existing avatar: {scene_path}")
         return scene_path
@@ -1539,18 +1670,9 @@ def create_person_narration_scene(script: str, speaker_gender: str, title: str)
         
         # If no existing avatar, create a person-like figure using simple shapes
         print("🎭 No existing avatar found, creating simple person figure...")
-        img = Image.new('RGB', (720, 1280), "#1a1a2e")
-        draw = ImageDraw.Draw(img)
-        
         # Create gradient background
-        for y in range(1280):
-            ratio = y / 1280
-            r = int(26 + 50 * ratio)
-            g = int(26 + 100 * ratio)
-            b = int(46 + 80 * ratio)
-            r, g, b = min(255, r), min(255, g), min(255, b)
-            color = (r, g, b)
-            draw.line([(0, y), (720, y)], fill=color)
+        img = _vertical_gradient(720, 1280, (26, 26, 46), (50, 100, 80))
+        draw = ImageDraw.Draw(img)
         
         # Draw a simple person figure
         person_x = 360  # Center of image
@@ -1586,12 +1708,8 @@ def create_person_narration_scene(script: str, speaker_gender: str, title: str)
                       fill="#FFD700", outline="#FFFFFF", width=2)
         
         # Add title
-        try:
-            title_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 48)
-            script_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 24)
-        except:
-            title_font = ImageFont.load_default()
-            script_font = ImageFont.load_default()
+        title_font = _load_font(48)
+        script_font = _load_font(24)
         
         # Title at top
         draw.text((360, 50), title, font=title_font, fill="#FFD700", anchor="mm")
@@ -1608,7 +1726,7 @@ def create_person_narration_scene(script: str, speaker_gender: str, title: str)
         
         # Save scene
         with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as tmp_file:
-            img.save(tmp_file.name, 'PNG')
+            img.save(tmp_file, 'PNG', compress_level=1)
             return tmp_file.name
             
     except Exception as e:
@@ -1629,12 +1747,7 @@ def create_person_video(audio_path: str, person_scene_path: str, output_dir: Pat
     """
     try:
         # Get audio duration
-        duration_cmd = [
-            'ffprobe', '-v', 'quiet', '-show_entries', 'format=duration',
-            '-of', 'csv=p=0', audio_path
-        ]
-        result = subprocess.run(duration_cmd, capture_output=True, text=True)
-        duration = float(result.stdout.strip())
+        duration = get_audio_duration(audio_path)
         
         # Generate output filename
         output_filename = f"person_narration_{int(duration)}s.mp4"
@@ -1646,6 +1759,7 @@ def create_person_video(audio_path: str, person_scene_path: str, output_dir: Pat
             '-loop', '1', '-i', person_scene_path,  # Input image (loop for duration)
             '-i', audio_path,  # Input audio
             '-c:v', 'libx264', '-tune', 'stillimage',  # Video codec
+            '-threads', '0', '-preset', 'veryfast',  # All cores; still images gain nothing from slower presets
             '-c:a', 'aac',  # Audio codec
             '-b:a', '192k',  # Audio bitrate
             '-pix_fmt', 'yuv420p',  # Pixel format for compatibility
@@ -0,0 +1,45 @@
+"""
+Hash Utilities - Fast content hashes for cache keys
+"""
+
+import hashlib
+
+# BLAKE3 is SIMD-vectorized (AVX2/AVX-512/NEON) and several times faster
+# than SHA-256 on large media files; fall back to SHA-256 (the previous key
+# format) when it isn't installed
+try:
+    from blake3 import blake3 as _hasher
+except ImportError:
+    _hasher = hashlib.sha256
+
+_CHUNK_SIZE = 1 << 20
+
+
+def bytes_digest(data: bytes) -> str:
+    """
+    Hash an in-memory buffer
+    
+    Args:
+        data (bytes): Content to hash
+        
+    Returns:
+        str: Hex digest (BLAKE3, or SHA-256 without the blake3 package)
+    """
+    return _hasher(data).hexdigest()
+
+
+def file_digest(path: str) -> str:
+    """
+    Hash a file's content, reading it in 1 MiB chunks
+    
+    Args:
+        path (str): Path of the file to hash
+        
+    Returns:
+        str: Hex digest (BLAKE3, or SHA-256 without the blake3 package)
+    """
+    digest = _hasher()
+    with open(path, 'rb', buffering=0) as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
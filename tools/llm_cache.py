@@ -0,0 +1,148 @@
+"""
+LLM Cache - Exact-match response cache for the Gemini-backed tools
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+
+CACHE_PATH = Path(os.getenv('LLM_CACHE_PATH', 'cache/llm_cache.sqlite3'))
+# Responses older than this are regenerated (0 disables expiry)
+CACHE_TTL_SECONDS = float(os.getenv('LLM_CACHE_TTL_SECONDS', '86400'))
+_MEMORY_MAX_ENTRIES = 1024
+
+# In-process front for the SQLite store: key -> (serialized value, created_at)
+_memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+_memory_lock = threading.Lock()
+
+# One SQLite connection per thread (connections can't be shared across
+# threads), opened lazily; the schema is set up by the first one only
+_local = threading.local()
+_schema_lock = threading.Lock()
+_schema_ready = False
+
+
+def make_key(tool_name: str, model_name: str, payload: Any) -> str:
+    """
+    Build a cache key for an LLM call
+
+    Args:
+        tool_name (str): Name of the tool making the call
+        model_name (str): Gemini model that produces the response
+        payload (Any): Tool input (text, or JSON-serializable data)
+
+    Returns:
+        str: SHA-256 hex digest identifying the request
+    """
+    if not isinstance(payload, str):
+        payload = json.dumps(payload, sort_keys=True)
+
+    # Whitespace differences don't change what the model sees in practice
+    normalized = " ".join(payload.split())
+    key_source = f"{model_name}\x00{tool_name}\x00{normalized}"
+    return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+
+def _create_schema(conn: sqlite3.Connection) -> None:
+    with conn:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL DEFAULT 0)"
+        )
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(responses)")}
+        if "created_at" not in columns:
+            # Caches written before expiry existed; their rows count as stale
+            conn.execute("ALTER TABLE responses ADD COLUMN created_at REAL NOT NULL DEFAULT 0")
+
+
+def _connect() -> sqlite3.Connection:
+    global _schema_ready
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        return conn
+
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(CACHE_PATH)
+    try:
+        with _schema_lock:
+            if not _schema_ready:
+                _create_schema(conn)
+                _schema_ready = True
+    except sqlite3.Error:
+        conn.close()
+        raise
+    _local.conn = conn
+    return conn
+
+
+def _remember(key: str, entry: Tuple[str, float]) -> None:
+    with _memory_lock:
+        _memory[key] = entry
+        _memory.move_to_end(key)
+        if len(_memory) > _MEMORY_MAX_ENTRIES:
+            _memory.popitem(last=False)
+
+
+def _load(key: str) -> Optional[Tuple[str, float]]:
+    with _memory_lock:
+        entry = _memory.get(key)
+        if entry is not None:
+            _memory.move_to_end(key)
+            return entry
+    row = _connect().execute("SELECT value, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+    if row is None:
+        return None
+    entry = (row[0], row[1])
+    _remember(key, entry)
+    return entry
+
+
+def get(key: str) -> Optional[Any]:
+    """
+    Look up a cached LLM response
+
+    Args:
+        key (str): Key from make_key()
+
+    Returns:
+        Any: The cached response, or None on a miss
+    """
+    try:
+        entry = _load(key)
+    except sqlite3.Error as e:
+        print(f"Warning: Could not read LLM cache: {e}")
+        return None
+
+    if entry is None:
+        return None
+    value, created_at = entry
+    if CACHE_TTL_SECONDS and time.time() - created_at > CACHE_TTL_SECONDS:
+        return None
+    return json.loads(value)
+
+
+def put(key: str, value: Any) -> None:
+    """
+    Store an LLM response in the cache
+
+    Args:
+        key (str): Key from make_key()
+        value (Any): JSON-serializable response to store
+    """
+    entry = (json.dumps(value), time.time())
+    _remember(key, entry)
+    try:
+        with _connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created_at) VALUES (?, ?, ?)",
+                (key, *entry)
+            )
+    except sqlite3.Error as e:
+        print(f"Warning: Could not write LLM cache: {e}")
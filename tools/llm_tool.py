@@ -1,19 +1,155 @@
 import os
 import json
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
 from dotenv import load_dotenv
 import google.generativeai as genai
 
+# orjson is a C/SIMD JSON parser several times faster than the stdlib one;
+# its decode error subclasses json.JSONDecodeError, so error handling below
+# works with either
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 # Load environment variables
 load_dotenv()
 
-# Configure Gemini API
-api_key = os.getenv('GOOGLE_API_KEY')
-if not api_key:
-    raise ValueError("GOOGLE_API_KEY not found in environment variables")
+MODEL_NAME = 'gemini-2.5-flash'
+
+# Fixed instructions go in each tool's system instruction and only the
+# per-call data is sent as content, so every request for a tool starts with
+# the same prefix and Gemini's implicit prompt caching can reuse it
+_KEY_MOMENTS_INSTRUCTION = """
+Analyze the video transcript you are given and identify ALL viral-worthy moments that would work well for short-form content (TikTok, Instagram Reels, YouTube Shorts). Don't limit yourself to a specific number - find as many genuinely viral moments as exist in the content.
+
+For each moment, provide:
+1. A brief summary (1-2 sentences)
+2. The approximate timestamp (if available from context)
+3. Why it's viral-worthy (humor, shock value, educational, emotional, etc.)
+4. The exact quote or key phrase
+5. Suggested hook for the short video
+6. Priority level (high/medium/low) for script inclusion
+
+Return your response as a JSON array with this structure:
+[
+    {
+        "summary": "Brief description of the moment",
+        "timestamp": "Approximate time (e.g., '2:30-3:15')",
+        "viral_factor": "Why this moment is viral-worthy",
+        "quote": "Exact quote or key phrase",
+        "hook": "Suggested opening hook for short video",
+        "priority": "high/medium/low",
+        "confidence": 0.9
+    }
+]
+"""
+
+_SPEAKER_GENDER_INSTRUCTION = """
+Analyze the transcript you are given and determine the likely gender of the speaker based on:
+- Speaking patterns and language use
+- Self-references and pronouns
+- Content context clues
+- Any explicit gender indicators
+
+Respond with only one word: "male", "female", or "unknown"
+"""
+
+_SHORT_SCRIPT_INSTRUCTION = """
+You are an expert content creator specializing in viral short-form videos. Create a compelling, engaging script that transforms the provided viral moments into a cohesive, shareable story.
+
+SCRIPT REQUIREMENTS:
+1. HOOK (First 3 seconds): Start with the most shocking, surprising, or intriguing moment
+2. FLOW: Create smooth transitions between moments using connecting phrases like "But here's the thing...", "What's crazy is...", "And then...", "But wait..."
+3. TONE: Conversational, authentic, and engaging - like talking to a friend
+4. STRUCTURE: Hook → Build tension → Reveal/Climax → Strong ending
+5. EMOTION: Include emotional triggers (shock, surprise, humor, relatability)
+6. CLARITY: Make it easy to follow and understand
+7. IMPACT: Every sentence should add value or emotion
+
+WRITING STYLE (STRICT):
+- Single-person monologue only
+- NO labels like VOICEOVER:, REPORTER:, SFX:, MUSIC:
+- NO stage directions or sound cues (no brackets [] or parentheses ())
+- Use short, punchy sentences and natural speech patterns
+- Include specific details and numbers when available
+- End with a memorable statement
+
+QUALITY CHECK:
+- Does it grab attention immediately?
+- Is it easy to follow from start to finish?
+- Does it build emotional engagement?
+- Would someone want to share this?
+- Is it coherent and logical?
+
+Create a script that tells a complete, engaging story using ONLY the provided viral moments. Output only plain script text as a monologue with no labels or cues.
+"""
+
+# The batch variant reuses the single-script rules and only changes the
+# output format
+_SCRIPTS_BATCH_INSTRUCTION = _SHORT_SCRIPT_INSTRUCTION + """
+BATCH OUTPUT:
+You will be given several numbered viral moments. Write a separate, self-contained script for EACH moment.
+Return a JSON array of strings, one plain-text monologue per moment, in the same order as the moments.
+"""
+
+_COMPREHENSIVE_SCRIPT_INSTRUCTION = """
+Create a highly engaging, viral-worthy audio script that ONLY includes the viral moments provided. This script should be optimized for short-form social media platforms (TikTok, Instagram Reels, YouTube Shorts) and designed to maximize engagement.
+
+CRITICAL REQUIREMENTS:
+- ONLY include the viral moments listed - do not add any extra content, background information, or filler
+- Start with the most viral moment as a powerful hook (first 3 seconds are crucial for retention)
+- Create smooth, natural transitions between moments using connecting phrases
+- Keep it concise and impactful - every word should add value and emotion
+- Write in a conversational, authentic tone that feels natural and engaging
+- Use natural speech patterns with strategic pauses, emphasis, and rhythm
+- The script should be 30-90 seconds maximum
+- Focus on the most impactful quotes and key points from each moment
+- Add emotional triggers and storytelling elements to make it shareable
+- Use exclamations, questions, and dramatic pauses where appropriate
+- Make each moment flow into the next with smooth transitions
+- Include specific details and examples to make it relatable
+- End with a strong, memorable closing that encourages sharing
+
+Create a clean, engaging monologue that covers ONLY these viral moments in a compelling narrative flow. Focus on emotional impact, relatability, and shareability. No extra content, no filler, no background information.
+
+STRICT OUTPUT:
+- Single-person monologue only
+- No labels like VOICEOVER:, REPORTER:, SFX:, MUSIC:
+- No stage directions or sound cues (no [] or ())
+- Return only plain script text
+"""
+
+
+@lru_cache(maxsize=None)
+def get_llm_client(system_instruction: Optional[str] = None) -> genai.GenerativeModel:
+    """
+    Get the Gemini model for a system instruction, configuring the API on first use
+    
+    Configuration is deferred to the first call so importing this module
+    doesn't require GOOGLE_API_KEY (e.g. while the Streamlit app is still
+    waiting for it); a failed call isn't cached, so a key set later is picked up.
+    
+    Args:
+        system_instruction (str, optional): Fixed instruction for the model
+        
+    Returns:
+        genai.GenerativeModel: Model instance shared by all callers
+        
+    Raises:
+        ValueError: If GOOGLE_API_KEY is not set
+    """
+    _configure_gemini()
+    return genai.GenerativeModel(MODEL_NAME, system_instruction=system_instruction)
+
 
-genai.configure(api_key=api_key)
-model = genai.GenerativeModel('gemini-2.5-flash')
+@lru_cache(maxsize=1)
+def _configure_gemini() -> None:
+    api_key = os.getenv('GOOGLE_API_KEY')
+    if not api_key:
+        raise ValueError("GOOGLE_API_KEY not found in environment variables")
+    genai.configure(api_key=api_key)
 
 
 def find_key_moments(transcript: str) -> List[Dict[str, Any]]:
@@ -30,35 +166,7 @@ def find_key_moments(transcript: str) -> List[Dict[str, Any]]:
         Exception: If analysis fails or API key is invalid
     """
     try:
-        prompt = f"""
-        Analyze this video transcript and identify ALL viral-worthy moments that would work well for short-form content (TikTok, Instagram Reels, YouTube Shorts). Don't limit yourself to a specific number - find as many genuinely viral moments as exist in the content.
-
-        For each moment, provide:
-        1. A brief summary (1-2 sentences)
-        2. The approximate timestamp (if available from context)
-        3. Why it's viral-worthy (humor, shock value, educational, emotional, etc.)
-        4. The exact quote or key phrase
-        5. Suggested hook for the short video
-        6. Priority level (high/medium/low) for script inclusion
-
-        Transcript:
-        {transcript}
-
-        Return your response as a JSON array with this structure:
-        [
-            {{
-                "summary": "Brief description of the moment",
-                "timestamp": "Approximate time (e.g., '2:30-3:15')",
-                "viral_factor": "Why this moment is viral-worthy",
-                "quote": "Exact quote or key phrase",
-                "hook": "Suggested opening hook for short video",
-                "priority": "high/medium/low",
-                "confidence": 0.9
-            }}
-        ]
-        """
-
-        response = model.generate_content(prompt)
+        response = get_llm_client(_KEY_MOMENTS_INSTRUCTION).generate_content(f"Transcript:\n{transcript}")
         
         # Extract JSON from response
         response_text = response.text.strip()
@@ -76,7 +184,7 @@ def find_key_moments(transcript: str) -> List[Dict[str, Any]]:
             json_text = response_text
         
         # Parse JSON
-        moments = json.loads(json_text)
+        moments = _json_loads(json_text)
         
         if not isinstance(moments, list):
             raise Exception("Invalid response format from Gemini")
@@ -161,10 +269,24 @@ def validate_and_improve_script(script: str) -> str:
         return script
 
 
+@lru_cache(maxsize=256)
+def _classify_speaker_gender(transcript_excerpt: str) -> str:
+    response = get_llm_client(_SPEAKER_GENDER_INSTRUCTION).generate_content(f"Transcript: {transcript_excerpt}...")
+    gender = response.text.strip().lower()
+    
+    if gender in ["male", "female", "unknown"]:
+        return gender
+    else:
+        return "unknown"
+
+
 def detect_speaker_gender(transcript: str) -> str:
     """
     Detect the gender of the speaker from transcript content using Gemini AI
     
+    Results are memoized per transcript, so repeated calls in one pipeline
+    run don't go back to the API.
+    
     Args:
         transcript (str): The transcript text to analyze
         
@@ -172,25 +294,8 @@ def detect_speaker_gender(transcript: str) -> str:
         str: "male", "female", or "unknown"
     """
     try:
-        prompt = f"""
-        Analyze this transcript and determine the likely gender of the speaker based on:
-        - Speaking patterns and language use
-        - Self-references and pronouns
-        - Content context clues
-        - Any explicit gender indicators
-
-        Transcript: {transcript[:1000]}...
-
-        Respond with only one word: "male", "female", or "unknown"
-        """
-        
-        response = model.generate_content(prompt)
-        gender = response.text.strip().lower()
-        
-        if gender in ["male", "female", "unknown"]:
-            return gender
-        else:
-            return "unknown"
+        # Only the first 1000 characters reach the prompt, so they are the cache key
+        return _classify_speaker_gender(transcript[:1000])
             
     except Exception as e:
         print(f"Warning: Could not detect speaker gender: {e}")
@@ -219,42 +324,9 @@ def generate_short_script(moment_summary: str, speaker_gender: str = "unknown")
         elif speaker_gender == "female":
             gender_context = " The original speaker appears to be female, so write in a natural, engaging female voice style."
         
-        prompt = f"""
-        You are an expert content creator specializing in viral short-form videos. Create a compelling, engaging script that transforms the provided viral moments into a cohesive, shareable story.
-
-        VIRAL MOMENTS TO WORK WITH:
-        {moment_summary}
-
-        SCRIPT REQUIREMENTS:
-        1. HOOK (First 3 seconds): Start with the most shocking, surprising, or intriguing moment
-        2. FLOW: Create smooth transitions between moments using connecting phrases like "But here's the thing...", "What's crazy is...", "And then...", "But wait..."
-        3. TONE: Conversational, authentic, and engaging - like talking to a friend
-        4. STRUCTURE: Hook → Build tension → Reveal/Climax → Strong ending
-        5. EMOTION: Include emotional triggers (shock, surprise, humor, relatability)
-        6. CLARITY: Make it easy to follow and understand
-        7. IMPACT: Every sentence should add value or emotion
-
-        WRITING STYLE (STRICT):
-        - Single-person monologue only
-        - NO labels like VOICEOVER:, REPORTER:, SFX:, MUSIC:
-        - NO stage directions or sound cues (no brackets [] or parentheses ())
-        - Use short, punchy sentences and natural speech patterns
-        - Include specific details and numbers when available
-        - End with a memorable statement
-
-        QUALITY CHECK:
-        - Does it grab attention immediately?
-        - Is it easy to follow from start to finish?
-        - Does it build emotional engagement?
-        - Would someone want to share this?
-        - Is it coherent and logical?
-
-        {gender_context}
-
-        Create a script that tells a complete, engaging story using ONLY the provided viral moments. Output only plain script text as a monologue with no labels or cues.
-        """
-
-        response = model.generate_content(prompt)
+        response = get_llm_client(_SHORT_SCRIPT_INSTRUCTION).generate_content(
+            f"VIRAL MOMENTS TO WORK WITH:\n{moment_summary}\n{gender_context}"
+        )
         script = response.text.strip()
         
         # Validate and improve script quality
@@ -267,6 +339,58 @@ def generate_short_script(moment_summary: str, speaker_gender: str = "unknown")
         raise Exception(f"Failed to generate script: {str(e)}")
 
 
+def generate_scripts_batch(moment_summaries: List[str], speaker_gender: str = "unknown") -> List[str]:
+    """
+    Generate one short script per viral moment in a single Gemini call
+    
+    Equivalent to calling generate_short_script on each summary, but all
+    scripts come back from one request as a JSON array instead of one round
+    trip per moment.
+    
+    Args:
+        moment_summaries (List[str]): Summaries of the moments to script
+        speaker_gender (str): Gender of the original speaker ("male", "female", "unknown")
+        
+    Returns:
+        List[str]: One script per summary, in the same order
+        
+    Raises:
+        Exception: If script generation fails
+    """
+    if len(moment_summaries) == 1:
+        return [generate_short_script(moment_summaries[0], speaker_gender)]
+    
+    try:
+        moments_text = "".join(f"\nMoment {i}: {summary}" for i, summary in enumerate(moment_summaries, 1))
+        
+        # Add gender context to the prompt
+        gender_context = ""
+        if speaker_gender == "male":
+            gender_context = " The original speaker appears to be male, so write in a natural, engaging male voice style."
+        elif speaker_gender == "female":
+            gender_context = " The original speaker appears to be female, so write in a natural, engaging female voice style."
+        
+        response = get_llm_client(_SCRIPTS_BATCH_INSTRUCTION).generate_content(
+            f"VIRAL MOMENTS TO WORK WITH ({len(moment_summaries)}):{moments_text}\n{gender_context}",
+            generation_config={"response_mime_type": "application/json"}
+        )
+        scripts = _json_loads(response.text)
+        
+        if not isinstance(scripts, list) or len(scripts) != len(moment_summaries):
+            raise Exception("Invalid response format from Gemini")
+        
+        # Validate and improve each script, as for a single script
+        scripts = [validate_and_improve_script(str(script).strip()) for script in scripts]
+        
+        print(f"Generated {len(scripts)} scripts in one request")
+        return scripts
+        
+    except json.JSONDecodeError as e:
+        raise Exception(f"Failed to parse Gemini response as JSON: {e}")
+    except Exception as e:
+        raise Exception(f"Failed to generate scripts: {str(e)}")
+
+
 def generate_comprehensive_script(viral_moments: List[Dict[str, Any]], speaker_gender: str = "unknown") -> str:
     """
     Generate a comprehensive script from multiple viral moments using Gemini AI
@@ -282,10 +406,9 @@ def generate_comprehensive_script(viral_moments: List[Dict[str, Any]], speaker_g
         Exception: If script generation fails
     """
     try:
-        # Format viral moments for the prompt
-        moments_text = ""
-        for i, moment in enumerate(viral_moments, 1):
-            moments_text += f"""
+        # Format viral moments for the prompt (one join rather than repeated +=)
+        moments_text = "".join(
+            f"""
 Moment {i}:
 - Summary: {moment.get('summary', 'N/A')}
 - Quote: {moment.get('quote', 'N/A')}
@@ -294,6 +417,8 @@ Moment {i}:
 - Hook: {moment.get('hook', 'N/A')}
 - Timestamp: {moment.get('timestamp', 'N/A')}
 """
+            for i, moment in enumerate(viral_moments, 1)
+        )
         
         # Add gender context to the prompt
         gender_context = ""
@@ -302,37 +427,7 @@ Moment {i}:
         elif speaker_gender == "female":
             gender_context = " The original speaker appears to be female, so write in a natural, engaging female voice style."
         
-        prompt = f"""
-        Create a highly engaging, viral-worthy audio script that ONLY includes the viral moments provided below. This script should be optimized for short-form social media platforms (TikTok, Instagram Reels, YouTube Shorts) and designed to maximize engagement.
-
-        CRITICAL REQUIREMENTS:
-        - ONLY include the viral moments listed below - do not add any extra content, background information, or filler
-        - Start with the most viral moment as a powerful hook (first 3 seconds are crucial for retention)
-        - Create smooth, natural transitions between moments using connecting phrases
-        - Keep it concise and impactful - every word should add value and emotion
-        - Write in a conversational, authentic tone that feels natural and engaging
-        - Use natural speech patterns with strategic pauses, emphasis, and rhythm
-        - The script should be 30-90 seconds maximum
-        - Focus on the most impactful quotes and key points from each moment
-        - Add emotional triggers and storytelling elements to make it shareable
-        - Use exclamations, questions, and dramatic pauses where appropriate
-        - Make each moment flow into the next with smooth transitions
-        - Include specific details and examples to make it relatable
-        - End with a strong, memorable closing that encourages sharing
-
-        VIRAL MOMENTS TO INCLUDE (ONLY THESE):
-        {moments_text}
-
-        Create a clean, engaging monologue that covers ONLY these viral moments in a compelling narrative flow. Focus on emotional impact, relatability, and shareability. No extra content, no filler, no background information.
-
-        STRICT OUTPUT:
-        - Single-person monologue only
-        - No labels like VOICEOVER:, REPORTER:, SFX:, MUSIC:
-        - No stage directions or sound cues (no [] or ())
-        - Return only plain script text
-        """
-
-        response = model.generate_content(prompt)
+        response = get_llm_client(_COMPREHENSIVE_SCRIPT_INSTRUCTION).generate_content(f"VIRAL MOMENTS TO INCLUDE (ONLY THESE):\n{moments_text}")
         script = response.text.strip()
         
         # Validate and sanitize to enforce monologue without labels/SFX
@@ -370,7 +465,7 @@ def generate_quote_variations(quote: str) -> List[str]:
         Return as a JSON array of strings.
         """
 
-        response = model.generate_content(prompt)
+        response = get_llm_client().generate_content(prompt)
         response_text = response.text.strip()
         
         # Extract JSON
@@ -381,7 +476,7 @@ def generate_quote_variations(quote: str) -> List[str]:
         else:
             json_text = response_text
         
-        variations = json.loads(json_text)
+        variations = _json_loads(json_text)
         return variations
         
     except Exception as e:
@@ -437,7 +532,7 @@ def analyze_viral_potential(content: str) -> Dict[str, Any]:
         }}
         """
 
-        response = model.generate_content(prompt)
+        response = get_llm_client().generate_content(prompt)
         response_text = response.text.strip()
         
         # Extract JSON
@@ -448,7 +543,7 @@ def analyze_viral_potential(content: str) -> Dict[str, Any]:
         else:
             json_text = response_text
         
-        analysis = json.loads(json_text)
+        analysis = _json_loads(json_text)
         return analysis
         
     except Exception as e:
@@ -0,0 +1,55 @@
+"""
+Single Flight - Share one in-progress call between concurrent identical requests
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    Run at most one call per key at a time.
+
+    The first caller for a key runs the function; callers that arrive with
+    the same key while it is still running wait for and share its result
+    (or its exception) instead of running it again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, Future] = {}
+
+    def run(self, key: Hashable, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Call fn(*args, **kwargs), joining an identical call already in progress
+
+        Args:
+            key (Hashable): Identifies calls whose results are interchangeable
+            fn (Callable): Function to run
+            *args, **kwargs: Arguments for fn
+
+        Returns:
+            Any: The result of fn
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
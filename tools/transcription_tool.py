@@ -1,23 +1,185 @@
 """
-Transcription Tool - Transcribe audio files using local OpenAI Whisper
+Transcription Tool - Transcribe audio files using local Whisper (faster-whisper when available)
 """
 
 import os
+import json
+import tempfile
+import threading
 import whisper
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+from tools.hashutil import bytes_digest, file_digest
 
+# faster-whisper runs Whisper through CTranslate2 with int8 weights, which is
+# several times faster than openai-whisper; fall back when it isn't installed
+try:
+    from faster_whisper import WhisperModel as FasterWhisperModel
+except ImportError:
+    FasterWhisperModel = None
 
-def transcribe_audio(audio_path: str) -> str:
+# Batched inference (faster-whisper >= 1.1) splits audio on VAD speech
+# segments and decodes them in parallel batches instead of one 30 s window
+# at a time
+try:
+    from faster_whisper import BatchedInferencePipeline
+except ImportError:
+    BatchedInferencePipeline = None
+
+# Transcripts keyed by audio content + model, so re-running the pipeline on
+# the same audio skips Whisper entirely
+TRANSCRIPT_CACHE_DIR = Path(os.getenv('TRANSCRIPT_CACHE_DIR', 'cache/transcripts'))
+
+WHISPER_BATCH_SIZE = int(os.getenv('WHISPER_BATCH_SIZE', '16'))
+
+# CTranslate2 compute type override (e.g. int8, int8_float16, float16); by
+# default int8 on CPU and int8_float16 on CUDA
+WHISPER_COMPUTE_TYPE = os.getenv('WHISPER_COMPUTE_TYPE')
+
+# openai-whisper installs per-call hooks on the shared model, so inference on
+# one loaded model must not overlap (CTranslate2 models are thread-safe)
+_whisper_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _faster_whisper_device() -> tuple:
+    """
+    Resolve the (device, compute_type) faster-whisper models are loaded with
+    """
+    import torch
+    
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    compute_type = WHISPER_COMPUTE_TYPE or ("int8_float16" if device == "cuda" else "int8")
+    return device, compute_type
+
+
+@lru_cache(maxsize=2)
+def load_whisper_model(model_size: str):
+    """
+    Load a Whisper model once per process and reuse it across calls
+    
+    Uses faster-whisper with int8 weights (int8_float16 on CUDA) when it is
+    installed, wrapped in its batched pipeline when available, otherwise the
+    FP32 openai-whisper model.
+    
+    With faster-whisper, model_size may also be the path of a converted
+    CTranslate2 model directory (see README).
+    
+    Args:
+        model_size (str): Whisper model size (tiny, base, small, medium, large)
+        
+    Returns:
+        The loaded model (faster_whisper.BatchedInferencePipeline,
+        faster_whisper.WhisperModel or whisper.Whisper)
+    """
+    if FasterWhisperModel is not None:
+        device, compute_type = _faster_whisper_device()
+        print(f"Loading faster-whisper model: {model_size} ({device}, {compute_type})")
+        model = FasterWhisperModel(model_size, device=device, compute_type=compute_type)
+        if BatchedInferencePipeline is not None:
+            return BatchedInferencePipeline(model=model)
+        return model
+    
+    print(f"Loading Whisper model: {model_size}")
+    return whisper.load_model(model_size)
+
+
+def _run_transcription(model, audio, word_timestamps: bool = False, vad_filter: bool = True) -> dict:
+    """
+    Transcribe with either backend and return openai-whisper's result shape
+    
+    vad_filter only applies to the batched faster-whisper pipeline.
+    """
+    if FasterWhisperModel is not None:
+        options = {'word_timestamps': word_timestamps}
+        if BatchedInferencePipeline is not None and isinstance(model, BatchedInferencePipeline):
+            options.update(batch_size=WHISPER_BATCH_SIZE, vad_filter=vad_filter)
+        segments, info = model.transcribe(audio, **options)
+        segment_dicts = []
+        for segment in segments:
+            segment_dict = {
+                'id': segment.id,
+                'start': segment.start,
+                'end': segment.end,
+                'text': segment.text,
+            }
+            if word_timestamps and segment.words:
+                segment_dict['words'] = [
+                    {'word': w.word, 'start': w.start, 'end': w.end, 'probability': w.probability}
+                    for w in segment.words
+                ]
+            segment_dicts.append(segment_dict)
+        return {
+            'text': "".join(s['text'] for s in segment_dicts),
+            'segments': segment_dicts,
+            'language': info.language
+        }
+    
+    with _whisper_lock:
+        return model.transcribe(audio, word_timestamps=word_timestamps)
+
+
+def _transcript_cache_path(audio_path: str, model_size: str, kind: str) -> Path:
+    digest = file_digest(audio_path)
+    if FasterWhisperModel is None:
+        backend = "whisper"
+    elif BatchedInferencePipeline is None:
+        backend = f"faster-whisper-{_faster_whisper_device()[1]}"
+    else:
+        backend = f"faster-whisper-batched-{_faster_whisper_device()[1]}"
+    # model_size may be a model directory; keep only its name in the file name,
+    # plus a short hash of its full path so same-named directories don't collide
+    model_path = Path(model_size)
+    model_name = model_path.name
+    if model_path.is_dir():
+        model_name = f"{model_name}-{bytes_digest(str(model_path.resolve()).encode('utf-8'))[:12]}"
+    return TRANSCRIPT_CACHE_DIR / f"{digest}-{backend}-{model_name}-{kind}.json"
+
+
+def _read_cached_transcript(cache_path: Path):
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cached_transcript(cache_path: Path, value) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so a concurrent reader never sees a partial file
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=cache_path.parent, suffix='.tmp', delete=False) as f:
+            json.dump(value, f)
+        os.replace(f.name, cache_path)
+    except OSError as e:
+        print(f"Warning: Could not write transcript cache: {e}")
+
+
+def warm_up_whisper(model_size: Optional[str] = None) -> None:
+    """
+    Load the Whisper model and run one silent inference so the first real
+    transcription doesn't pay for model load and kernel warm-up
+    
+    Args:
+        model_size (str, optional): Whisper model size (defaults to WHISPER_MODEL, then "base")
+    """
+    import numpy as np
+    
+    model = load_whisper_model(model_size or os.getenv('WHISPER_MODEL', 'base'))
+    # VAD would drop the silent clip before it reaches the model, so the
+    # decoder would never actually run
+    _run_transcription(model, np.zeros(16000, dtype=np.float32), vad_filter=False)
+
+
+def transcribe_audio(audio_path: str, model_size: Optional[str] = None) -> str:
     """
     Transcribe audio file to text using local OpenAI Whisper model
     
     Args:
         audio_path (str): Path to the audio file to transcribe
+        model_size (str, optional): Whisper model size (defaults to WHISPER_MODEL, then "base")
         
     Returns:
         str: Full text transcript
@@ -30,20 +192,26 @@ def transcribe_audio(audio_path: str) -> str:
         if not os.path.exists(audio_path):
             raise Exception(f"Audio file not found: {audio_path}")
         
-        # Get model size from environment (default: base)
-        model_size = os.getenv('WHISPER_MODEL', 'base')
+        # Get model size from environment unless given (default: base)
+        model_size = model_size or os.getenv('WHISPER_MODEL', 'base')
+        
+        cache_path = _transcript_cache_path(audio_path, model_size, "text")
+        transcript = _read_cached_transcript(cache_path)
+        if transcript:
+            print(f"Using cached transcript for: {audio_path}")
+            return transcript
         
-        print(f"Loading Whisper model: {model_size}")
-        model = whisper.load_model(model_size)
+        model = load_whisper_model(model_size)
         
         print(f"Transcribing audio: {audio_path}")
-        result = model.transcribe(audio_path)
+        result = _run_transcription(model, audio_path)
         
         transcript = result["text"].strip()
         
         if not transcript:
             raise Exception("No speech detected in audio file")
         
+        _write_cached_transcript(cache_path, transcript)
         print(f"Transcription completed. Length: {len(transcript)} characters")
         return transcript
         
@@ -51,12 +219,13 @@ def transcribe_audio(audio_path: str) -> str:
         raise Exception(f"Failed to transcribe audio: {str(e)}")
 
 
-def transcribe_with_timestamps(audio_path: str) -> dict:
+def transcribe_with_timestamps(audio_path: str, model_size: Optional[str] = None) -> dict:
     """
     Transcribe audio file with word-level timestamps
     
     Args:
         audio_path (str): Path to the audio file to transcribe
+        model_size (str, optional): Whisper model size (defaults to WHISPER_MODEL, then "base")
         
     Returns:
         dict: Transcript with segments and timestamps
@@ -65,17 +234,26 @@ def transcribe_with_timestamps(audio_path: str) -> dict:
         if not os.path.exists(audio_path):
             raise Exception(f"Audio file not found: {audio_path}")
         
-        model_size = os.getenv('WHISPER_MODEL', 'base')
-        model = whisper.load_model(model_size)
+        model_size = model_size or os.getenv('WHISPER_MODEL', 'base')
+        
+        cache_path = _transcript_cache_path(audio_path, model_size, "timestamps")
+        cached = _read_cached_transcript(cache_path)
+        if cached:
+            print(f"Using cached timestamped transcript for: {audio_path}")
+            return cached
+        
+        model = load_whisper_model(model_size)
         
         print(f"Transcribing with timestamps: {audio_path}")
-        result = model.transcribe(audio_path, word_timestamps=True)
+        result = _run_transcription(model, audio_path, word_timestamps=True)
         
-        return {
+        transcript = {
             'text': result["text"].strip(),
             'segments': result.get("segments", []),
             'language': result.get("language", "unknown")
         }
+        _write_cached_transcript(cache_path, transcript)
+        return transcript
         
     except Exception as e:
         raise Exception(f"Failed to transcribe with timestamps: {str(e)}")
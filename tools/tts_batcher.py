@@ -0,0 +1,41 @@
+"""
+TTS Batcher - Coalesces identical concurrent text-to-speech requests
+"""
+
+from typing import Any, Callable
+
+from tools.single_flight import SingleFlight
+
+
+class TTSBatcher:
+    """
+    Share one synthesis between concurrent requests for the same script and voice.
+
+    The first caller for a (script_text, speaker_gender, options) key runs the TTS
+    function; callers that arrive while it is still running wait for and
+    reuse its audio path instead of paying for another request.
+    """
+
+    def __init__(self, synthesize: Callable[..., str]):
+        """
+        Args:
+            synthesize (Callable): TTS function taking (script_text, speaker_gender=..., **options)
+                and returning the generated audio path
+        """
+        self._synthesize = synthesize
+        self._flight = SingleFlight()
+
+    def submit(self, script_text: str, speaker_gender: str = "unknown", **options: Any) -> str:
+        """
+        Synthesize script_text, joining an identical request already in progress
+
+        Args:
+            script_text (str): Script text to convert to speech
+            speaker_gender (str): Speaker gender for voice selection
+            **options: Extra keyword arguments for the TTS function (e.g. model_id)
+
+        Returns:
+            str: Path to the generated audio file
+        """
+        key = (script_text, speaker_gender, tuple(sorted(options.items())))
+        return self._flight.run(key, self._synthesize, script_text, speaker_gender=speaker_gender, **options)
@@ -5,17 +5,24 @@ Video Tool - Create videos with voiceover and visual elements
 import os
 import tempfile
 import subprocess
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Tuple
 from PIL import Image, ImageDraw, ImageFont
-# MoviePy is optional; only needed for text-based video generation helpers
-try:
-    import moviepy.editor as mp
-except Exception:
-    mp = None  # Lazily required by functions that use MoviePy
 import textwrap
 
 
+def _import_moviepy(feature: str):
+    # MoviePy is optional and only needed for the text-based video helpers;
+    # importing it pulls in imageio and friends, so defer that cost until one
+    # of them actually runs instead of paying it every time this module loads
+    try:
+        import moviepy.editor as mp
+    except Exception:
+        raise Exception(f"moviepy is required for {feature}. Install with: pip install moviepy")
+    return mp
+
+
 def _get_audio_duration_seconds(audio_path: str) -> float:
     duration_cmd = [
         'ffprobe', '-v', 'quiet', '-show_entries', 'format=duration',
@@ -25,16 +32,70 @@ def _get_audio_duration_seconds(audio_path: str) -> float:
     return float(result.stdout.strip())
 
 
+@lru_cache(maxsize=1)
+def _has_nvenc() -> bool:
+    """
+    Whether NVIDIA's hardware H.264 encoder actually works here (checked once per process)
+    
+    Many FFmpeg builds list h264_nvenc without an NVIDIA GPU or driver to run
+    it, so this encodes a few blank frames rather than reading -encoders.
+    """
+    probe_cmd = [
+        'ffmpeg', '-hide_banner', '-v', 'error',
+        '-f', 'lavfi', '-i', 'color=s=256x256:d=0.1',
+        '-c:v', 'h264_nvenc', '-f', 'null', '-'
+    ]
+    try:
+        result = subprocess.run(probe_cmd, capture_output=True, timeout=30)
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return result.returncode == 0
+
+
+def _run_ffmpeg(
+    cmd: List[str],
+    duration: float,
+    progress_callback: Optional[Callable[[float], None]] = None
+) -> Tuple[int, str]:
+    """
+    Run an FFmpeg command and return its exit code and stderr. If given,
+    progress_callback is called with the fraction of duration written so far,
+    parsed from FFmpeg's -progress output as the encode runs.
+    """
+    if progress_callback is None:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        return result.returncode, result.stderr
+
+    cmd = [cmd[0], '-progress', 'pipe:1', '-nostats'] + cmd[1:]
+    # stderr goes to a file so FFmpeg can't stall on a full pipe while we
+    # read progress from stdout
+    with tempfile.TemporaryFile(mode='w+') as stderr_file:
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file, text=True) as proc:
+            for line in proc.stdout:
+                key, _, value = line.strip().partition('=')
+                if key == 'out_time_us' and value.isdigit() and duration > 0:
+                    progress_callback(min(int(value) / 1e6 / duration, 1.0))
+        stderr_file.seek(0)
+        return proc.returncode, stderr_file.read()
+
+
 def create_looped_video_with_audio(
     voiceover_path: str,
     background_video_path: str,
     output_path: str | None = None,
-    fps: int = 30,
-    crf: int = 20,
-    preset: str = 'medium'
+    fps: Optional[int] = None,
+    crf: Optional[int] = None,
+    preset: Optional[str] = None,
+    copy_video: bool = True,
+    progress_callback: Optional[Callable[[float], None]] = None
 ) -> str:
     """
     Loop a background video to match the voiceover duration and replace its audio.
+    With copy_video the background's video stream is copied as-is (no re-encode);
+    if FFmpeg can't copy it into MP4, it is re-encoded on the GPU with NVENC when
+    available, otherwise with libx264 at fps/crf/preset (30/20/medium by default).
+    Setting any of fps/crf/preset forces a re-encode so they take effect. If given,
+    progress_callback is called with the fraction (0.0-1.0) rendered so far.
     """
     try:
         output_dir = Path("generated_videos")
@@ -51,33 +112,67 @@ def create_looped_video_with_audio(
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Use stream_loop to repeat video frames, trim to duration, and map audio from voiceover
-        cmd = [
+        input_args = [
             'ffmpeg', '-y',
             '-stream_loop', '-1', '-i', background_video_path,
             '-i', voiceover_path,
             '-t', str(duration),
             '-map', '0:v:0', '-map', '1:a:0',
-            '-c:v', 'libx264', '-pix_fmt', 'yuv420p', '-r', str(fps), '-crf', str(crf), '-preset', preset,
+        ]
+        output_args = [
             '-c:a', 'aac', '-b:a', '192k', '-shortest', '-movflags', '+faststart',
             str(output_path)
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            raise Exception(f"FFmpeg error: {result.stderr}")
+        # Copying the looped stream is I/O-bound; re-encoding is the fallback,
+        # on the GPU when possible and libx264 if NVENC isn't usable
+        video_args_options = []
+        if copy_video and fps is None and crf is None and preset is None:
+            video_args_options.append(['-c:v', 'copy'])
+        fps = 30 if fps is None else fps
+        crf = 20 if crf is None else crf
+        preset = preset or 'medium'
+
+        if _has_nvenc():
+            video_args_options.append(
+                ['-c:v', 'h264_nvenc', '-preset', 'p4', '-rc', 'vbr', '-cq', str(crf), '-b:v', '0',
+                 '-pix_fmt', 'yuv420p', '-r', str(fps)]
+            )
+        video_args_options.append(
+            ['-c:v', 'libx264', '-pix_fmt', 'yuv420p', '-r', str(fps), '-crf', str(crf), '-preset', preset]
+        )
 
-        return str(output_path)
+        for video_args in video_args_options:
+            returncode, stderr = _run_ffmpeg(input_args + video_args + output_args, duration, progress_callback)
+            if returncode == 0:
+                if progress_callback:
+                    progress_callback(1.0)
+                return str(output_path)
+
+        raise Exception(f"FFmpeg error: {stderr}")
     except Exception as e:
         raise Exception(f"Failed to create looped video: {str(e)}")
 
 
-def create_sample_loop_video_from_script(script_text: str, background_video: str = "Sample_Video.mp4") -> str:
+def create_sample_loop_video_from_script(
+    script_text: str,
+    background_video: str = "Sample_Video.mp4",
+    progress_callback: Optional[Callable[[str], None]] = None,
+    api_key: Optional[str] = None
+) -> str:
     """
     Generate ElevenLabs audio from script and loop Sample_Video.mp4 to its duration.
+    If given, progress_callback is called with a short message as each stage starts
+    and with the narration path once it exists. api_key overrides ELEVENLABS_API_KEY.
     """
     # Use existing ElevenLabs integration for high-quality narration
     from tools.voice_tool import create_high_quality_voiceover
-    audio_path = create_high_quality_voiceover(script_text)
+    if progress_callback:
+        progress_callback("generating narration")
+    audio_path = create_high_quality_voiceover(script_text, api_key=api_key)
+    if progress_callback:
+        progress_callback(f"narration ready: {audio_path}")
+        progress_callback("rendering looped video")
     return create_looped_video_with_audio(audio_path, background_video_path=background_video)
 
 
@@ -104,8 +199,7 @@ def create_video_with_voiceover(
         str: Path to the generated video file
     """
     try:
-        if mp is None:
-            raise Exception("moviepy is required for create_video_with_voiceover. Install with: pip install moviepy")
+        _import_moviepy("create_video_with_voiceover")
         # Create output directory
         output_dir = Path("generated_videos")
         output_dir.mkdir(exist_ok=True)
@@ -245,8 +339,7 @@ def create_text_clips(
     Returns:
         List[mp.TextClip]: List of text clips
     """
-    if mp is None:
-        raise Exception("moviepy is required for create_text_clips. Install with: pip install moviepy")
+    mp = _import_moviepy("create_text_clips")
     clips = []
     
     # Split script into segments for different timing
@@ -371,8 +464,7 @@ def create_simple_video(
         str: Path to generated video
     """
     try:
-        if mp is None:
-            raise Exception("moviepy is required for create_simple_video. Install with: pip install moviepy")
+        mp = _import_moviepy("create_simple_video")
         # Create output directory
         output_dir = Path("generated_videos")
         output_dir.mkdir(exist_ok=True)
@@ -461,8 +553,7 @@ def create_quote_video(
         str: Path to generated video
     """
     try:
-        if mp is None:
-            raise Exception("moviepy is required for create_quote_video. Install with: pip install moviepy")
+        mp = _import_moviepy("create_quote_video")
         # Create output directory
         output_dir = Path("generated_videos")
         output_dir.mkdir(exist_ok=True)
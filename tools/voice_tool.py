@@ -5,6 +5,11 @@ Voice Tool - Generate voiceovers using local Coqui TTS
 import os
 import tempfile
 import re
+import shutil
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from TTS.api import TTS
@@ -77,7 +82,6 @@ def create_natural_voiceover(script_text: str) -> str:
         str: Path to the generated audio file
     """
     try:
-        import requests
         import tempfile
         
         # Use a lighter, more natural voice (not too deep)
@@ -93,7 +97,7 @@ def create_natural_voiceover(script_text: str) -> str:
         output_dir.mkdir(exist_ok=True)
         
         # ElevenLabs API endpoint
-        url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
+        url = f"{ELEVENLABS_API_BASE}/v1/text-to-speech/{voice_id}"
         
         headers = {
             "Accept": "audio/mpeg",
@@ -120,20 +124,13 @@ def create_natural_voiceover(script_text: str) -> str:
         
         print(f"Generating natural, lighter voiceover...")
         
-        # Make API request
-        response = requests.post(url, json=data, headers=headers)
-        
-        if response.status_code != 200:
-            raise Exception(f"ElevenLabs API error: {response.status_code} - {response.text}")
-        
         # Generate unique filename
         import time
         timestamp = int(time.time())
-        output_path = output_dir / f"natural_voiceover_{timestamp}.wav"
+        output_path = output_dir / f"natural_voiceover_{timestamp}_{uuid.uuid4().hex[:8]}.wav"
         
-        # Save audio to file
-        with open(output_path, 'wb') as f:
-            f.write(response.content)
+        # Stream the audio straight to the file
+        _stream_elevenlabs_audio(url, data, headers, output_path)
         
         print(f"Natural voiceover generated successfully: {output_path}")
         return str(output_path)
@@ -194,6 +191,180 @@ def clean_script_for_tts(script_text: str) -> str:
     return script_text
 
 
+# Shared Coqui models aren't safe to run from several threads at once
+_tts_lock = threading.Lock()
+
+
+@lru_cache(maxsize=4)
+def load_tts_model(voice_model: str) -> TTS:
+    """
+    Load a Coqui TTS model once per process and reuse it across calls
+    
+    Args:
+        voice_model (str): Coqui model name
+        
+    Returns:
+        TTS: The loaded model
+    """
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    print(f"Loading TTS model: {voice_model} ({device})")
+    return TTS(model_name=voice_model, progress_bar=True).to(device)
+
+
+def warm_up_tts(voice_model: str = "tts_models/en/vctk/vits") -> None:
+    """
+    Load the default Coqui model ahead of the first voiceover request
+    
+    Args:
+        voice_model (str): Coqui model name (defaults to the model used for male/unknown speakers)
+    """
+    load_tts_model(voice_model)
+
+
+ELEVENLABS_API_BASE = "https://api.elevenlabs.io"
+
+# Flash v2.5 is ElevenLabs' lowest-latency model at half the per-character
+# price of Multilingual v2, so it is the default for on-demand voiceovers
+ELEVENLABS_MODELS = ("eleven_flash_v2_5", "eleven_turbo_v2_5", "eleven_multilingual_v2")
+DEFAULT_ELEVENLABS_MODEL = "eleven_flash_v2_5"
+
+# Long scripts are split at sentence boundaries into requests of at most
+# ELEVENLABS_CHUNK_CHARS characters, synthesized in parallel (up to
+# ELEVENLABS_MAX_PARALLEL at once, within the account's concurrency limit)
+# and joined in order
+ELEVENLABS_CHUNK_CHARS = int(os.getenv('ELEVENLABS_CHUNK_CHARS', '800'))
+ELEVENLABS_MAX_PARALLEL = int(os.getenv('ELEVENLABS_MAX_PARALLEL', '4'))
+_SENTENCE_BREAK_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Retries per ElevenLabs request on 429 (rate limit) and 5xx responses
+ELEVENLABS_MAX_RETRIES = int(os.getenv('ELEVENLABS_MAX_RETRIES', '5'))
+
+
+@lru_cache(maxsize=1)
+def get_elevenlabs_session():
+    """
+    Shared HTTP session for ElevenLabs, so requests reuse pooled TLS connections
+    
+    Returns:
+        requests.Session: The process-wide session
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    # Rate-limited (429) and transient 5xx responses are retried, waiting for
+    # the server's Retry-After when given and jittered exponential backoff
+    # otherwise; once retries run out the last response is returned as-is so
+    # callers report the API error. TTS requests are POSTs, so they are
+    # allowed explicitly, but only for those statuses and for failures to
+    # connect: a read error may come after ElevenLabs has already generated
+    # (and billed) the audio, so it is never retried.
+    retry = Retry(
+        total=ELEVENLABS_MAX_RETRIES,
+        read=0,
+        other=0,
+        backoff_factor=1,
+        backoff_jitter=1,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD", "POST"}),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    # One keep-alive pool for the ElevenLabs host, sized to the number of
+    # concurrent voiceover jobs the MCP server allows
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=8, max_retries=retry)
+    session.mount(ELEVENLABS_API_BASE, adapter)
+    return session
+
+
+def _split_for_tts(text: str, max_chars: int) -> list:
+    """
+    Split text into runs of whole sentences of at most max_chars characters
+    (a single longer sentence becomes its own chunk)
+    """
+    chunks = []
+    current = ""
+    for sentence in _SENTENCE_BREAK_RE.split(text.strip()):
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _write_elevenlabs_audio(url: str, data: dict, headers: dict, output_path: Path) -> None:
+    with get_elevenlabs_session().post(f"{url}/stream", json=data, headers=headers, stream=True) as response:
+        if response.status_code != 200:
+            raise Exception(f"ElevenLabs API error: {response.status_code} - {response.text}")
+        
+        with open(output_path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                if chunk:
+                    f.write(chunk)
+
+
+def _stream_elevenlabs_audio(url: str, data: dict, headers: dict, output_path: Path) -> None:
+    """
+    POST a text-to-speech request to ElevenLabs' streaming endpoint and write
+    the audio to output_path chunk by chunk as it arrives, rather than
+    buffering the whole response in memory first
+    
+    Texts longer than ELEVENLABS_CHUNK_CHARS are synthesized as parallel
+    requests, each given its neighbours as previous_text/next_text so the
+    prosody carries across the joins; each part is streamed to its own
+    temporary file and the MP3 parts are concatenated in order.
+    """
+    chunks = _split_for_tts(data["text"], ELEVENLABS_CHUNK_CHARS)
+    if len(chunks) == 1:
+        _write_elevenlabs_audio(url, data, headers, output_path)
+        return
+    
+    chunk_requests = []
+    for i, chunk in enumerate(chunks):
+        chunk_data = dict(data, text=chunk)
+        if i > 0:
+            chunk_data["previous_text"] = chunks[i - 1]
+        if i < len(chunks) - 1:
+            chunk_data["next_text"] = chunks[i + 1]
+        chunk_requests.append(chunk_data)
+    
+    part_paths = []
+    try:
+        for _ in chunk_requests:
+            with tempfile.NamedTemporaryFile(suffix='.part.mp3', delete=False) as part_file:
+                part_paths.append(Path(part_file.name))
+        
+        with ThreadPoolExecutor(max_workers=min(len(chunks), ELEVENLABS_MAX_PARALLEL)) as executor:
+            # list() waits for every part and re-raises the first failure
+            list(executor.map(
+                lambda request: _write_elevenlabs_audio(url, request[0], headers, request[1]),
+                zip(chunk_requests, part_paths)
+            ))
+        
+        with open(output_path, 'wb') as f:
+            for part_path in part_paths:
+                with open(part_path, 'rb') as part:
+                    shutil.copyfileobj(part, f, 64 * 1024)
+    finally:
+        for part_path in part_paths:
+            part_path.unlink(missing_ok=True)
+
+
+def prewarm_elevenlabs_connection() -> None:
+    """
+    Open a pooled connection to ElevenLabs ahead of the first TTS request,
+    so the DNS lookup and TLS handshake are off the request's critical path
+    """
+    try:
+        get_elevenlabs_session().head(ELEVENLABS_API_BASE, timeout=5)
+    except Exception as e:
+        print(f"Warning: Could not prewarm ElevenLabs connection: {e}")
+
+
 def create_voiceover(script_text: str, voice_model: str = None, speaker_gender: str = "unknown") -> str:
     """
     Generate voiceover audio from script text using local Coqui TTS
@@ -223,15 +394,15 @@ def create_voiceover(script_text: str, voice_model: str = None, speaker_gender:
             else:
                 voice_model = "tts_models/en/vctk/vits"  # Default to multi-speaker model
         
-        print(f"Loading TTS model: {voice_model} for {speaker_gender} speaker")
+        print(f"Using TTS model: {voice_model} for {speaker_gender} speaker")
         
-        # Initialize TTS model
-        tts = TTS(model_name=voice_model, progress_bar=True)
+        # Reuse the process-wide model instead of reloading it per request
+        tts = load_tts_model(voice_model)
         
         # Generate unique filename
         import time
         timestamp = int(time.time())
-        output_path = output_dir / f"voiceover_{speaker_gender}_{timestamp}.wav"
+        output_path = output_dir / f"voiceover_{speaker_gender}_{timestamp}_{uuid.uuid4().hex[:8]}.wav"
         
         # Clean the script text before TTS
         cleaned_script = clean_script_for_tts(script_text)
@@ -247,10 +418,12 @@ def create_voiceover(script_text: str, voice_model: str = None, speaker_gender:
             else:
                 speaker_id = "p225"  # Default to male speaker
             print(f"Using speaker ID: {speaker_id} for {speaker_gender} voice")
-            tts.tts_to_file(text=cleaned_script, file_path=str(output_path), speaker=speaker_id)
+            with _tts_lock:
+                tts.tts_to_file(text=cleaned_script, file_path=str(output_path), speaker=speaker_id)
         else:
             # For single-speaker models, use default settings
-            tts.tts_to_file(text=cleaned_script, file_path=str(output_path))
+            with _tts_lock:
+                tts.tts_to_file(text=cleaned_script, file_path=str(output_path))
         
         print(f"Voiceover generated successfully: {output_path}")
         return str(output_path)
@@ -259,26 +432,26 @@ def create_voiceover(script_text: str, voice_model: str = None, speaker_gender:
         raise Exception(f"Failed to generate voiceover: {str(e)}")
 
 
-def create_high_quality_voiceover(script_text: str) -> str:
+def create_high_quality_voiceover(script_text: str, api_key: Optional[str] = None) -> str:
     """
     Generate high-quality voiceover using ElevenLabs with a single, professional narrator
     
     Args:
         script_text (str): Script text to convert to voiceover
+        api_key (str, optional): ElevenLabs API key (defaults to ELEVENLABS_API_KEY)
         
     Returns:
         str: Path to the generated audio file
     """
     try:
-        import requests
         import tempfile
         
         # Use a single, high-quality professional narrator voice
         # This is a premium ElevenLabs voice optimized for narration
         voice_id = "21m00Tcm4TlvDq8ikWAM"  # Adam - Professional, clear narrator
         
-        # Get API key from environment
-        api_key = os.getenv('ELEVENLABS_API_KEY')
+        # Fall back to the environment when the caller didn't pass a key
+        api_key = api_key or os.getenv('ELEVENLABS_API_KEY')
         if not api_key:
             raise Exception("ELEVENLABS_API_KEY not found in environment variables")
         
@@ -287,7 +460,7 @@ def create_high_quality_voiceover(script_text: str) -> str:
         output_dir.mkdir(exist_ok=True)
         
         # ElevenLabs API endpoint
-        url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
+        url = f"{ELEVENLABS_API_BASE}/v1/text-to-speech/{voice_id}"
         
         headers = {
             "Accept": "audio/mpeg",
@@ -312,20 +485,13 @@ def create_high_quality_voiceover(script_text: str) -> str:
         
         print(f"Generating high-quality voiceover with professional narrator...")
         
-        # Make API request
-        response = requests.post(url, json=data, headers=headers)
-        
-        if response.status_code != 200:
-            raise Exception(f"ElevenLabs API error: {response.status_code} - {response.text}")
-        
         # Generate unique filename
         import time
         timestamp = int(time.time())
-        output_path = output_dir / f"high_quality_voiceover_{timestamp}.wav"
+        output_path = output_dir / f"high_quality_voiceover_{timestamp}_{uuid.uuid4().hex[:8]}.wav"
         
-        # Save audio to file
-        with open(output_path, 'wb') as f:
-            f.write(response.content)
+        # Stream the audio straight to the file
+        _stream_elevenlabs_audio(url, data, headers, output_path)
         
         print(f"High-quality voiceover generated successfully: {output_path}")
         return str(output_path)
@@ -334,13 +500,20 @@ def create_high_quality_voiceover(script_text: str) -> str:
         raise Exception(f"Failed to generate high-quality voiceover: {str(e)}")
 
 
-def create_voiceover_with_elevenlabs(script_text: str, speaker_gender: str = "unknown") -> str:
+def create_voiceover_with_elevenlabs(
+    script_text: str,
+    speaker_gender: str = "unknown",
+    api_key: Optional[str] = None,
+    model_id: str = DEFAULT_ELEVENLABS_MODEL
+) -> str:
     """
     Generate voiceover audio using ElevenLabs TTS with gender-appropriate voice
     
     Args:
         script_text (str): Script text to convert to voiceover
         speaker_gender (str): Gender of the speaker ("male", "female", "unknown")
+        api_key (str, optional): ElevenLabs API key (defaults to ELEVENLABS_API_KEY)
+        model_id (str): ElevenLabs model (defaults to eleven_flash_v2_5; see ELEVENLABS_MODELS)
         
     Returns:
         str: Path to the generated audio file
@@ -349,7 +522,6 @@ def create_voiceover_with_elevenlabs(script_text: str, speaker_gender: str = "un
         Exception: If voice generation fails
     """
     try:
-        import requests
         import tempfile
         
         # Voice ID mapping for different genders - using high-quality voices
@@ -361,8 +533,8 @@ def create_voiceover_with_elevenlabs(script_text: str, speaker_gender: str = "un
         
         voice_id = voice_mapping.get(speaker_gender.lower(), voice_mapping["unknown"])
         
-        # Get API key from environment
-        api_key = os.getenv('ELEVENLABS_API_KEY')
+        # Fall back to the environment when the caller didn't pass a key
+        api_key = api_key or os.getenv('ELEVENLABS_API_KEY')
         if not api_key:
             raise Exception("ELEVENLABS_API_KEY not found in environment variables")
         
@@ -371,7 +543,7 @@ def create_voiceover_with_elevenlabs(script_text: str, speaker_gender: str = "un
         output_dir.mkdir(exist_ok=True)
         
         # ElevenLabs API endpoint
-        url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
+        url = f"{ELEVENLABS_API_BASE}/v1/text-to-speech/{voice_id}"
         
         headers = {
             "Accept": "audio/mpeg",
@@ -384,7 +556,7 @@ def create_voiceover_with_elevenlabs(script_text: str, speaker_gender: str = "un
         
         data = {
             "text": cleaned_script,
-            "model_id": "eleven_multilingual_v2",
+            "model_id": model_id,
             "voice_settings": {
                 "stability": 0.75,  # Higher stability for more consistent voice
                 "similarity_boost": 0.75,  # Higher similarity for better voice matching
@@ -393,22 +565,15 @@ def create_voiceover_with_elevenlabs(script_text: str, speaker_gender: str = "un
             }
         }
         
-        print(f"Generating {speaker_gender} voiceover with ElevenLabs voice {voice_id}...")
-        
-        # Make API request
-        response = requests.post(url, json=data, headers=headers)
-        
-        if response.status_code != 200:
-            raise Exception(f"ElevenLabs API error: {response.status_code} - {response.text}")
+        print(f"Generating {speaker_gender} voiceover with ElevenLabs voice {voice_id} ({model_id})...")
         
         # Generate unique filename
         import time
         timestamp = int(time.time())
-        output_path = output_dir / f"voiceover_{speaker_gender}_{timestamp}.wav"
+        output_path = output_dir / f"voiceover_{speaker_gender}_{timestamp}_{uuid.uuid4().hex[:8]}.wav"
         
-        # Save audio to file
-        with open(output_path, 'wb') as f:
-            f.write(response.content)
+        # Stream the audio straight to the file
+        _stream_elevenlabs_audio(url, data, headers, output_path)
         
         print(f"ElevenLabs voiceover generated successfully: {output_path}")
         return str(output_path)
@@ -444,20 +609,21 @@ def create_voiceover_with_emotion(script_text: str, emotion: str = "neutral") ->
         output_dir.mkdir(exist_ok=True)
         
         # Use a model that supports emotion control
-        tts = TTS(model_name="tts_models/en/ljspeech/tacotron2-DDC", progress_bar=True)
+        tts = load_tts_model("tts_models/en/ljspeech/tacotron2-DDC")
         
         import time
         timestamp = int(time.time())
-        output_path = output_dir / f"voiceover_{emotion}_{timestamp}.wav"
+        output_path = output_dir / f"voiceover_{emotion}_{timestamp}_{uuid.uuid4().hex[:8]}.wav"
         
         print(f"Generating {emotion} voiceover...")
         
         # Generate speech with emotion
-        tts.tts_to_file(
-            text=script_text, 
-            file_path=str(output_path),
-            speed=settings["speed"]
-        )
+        with _tts_lock:
+            tts.tts_to_file(
+                text=script_text, 
+                file_path=str(output_path),
+                speed=settings["speed"]
+            )
         
         print(f"Emotional voiceover generated: {output_path}")
         return str(output_path)
@@ -513,14 +679,15 @@ def create_multiple_voiceovers(script_text: str, voices: list = None) -> dict:
             try:
                 print(f"Generating voiceover with {voice}...")
                 
-                tts = TTS(model_name=voice, progress_bar=True)
+                tts = load_tts_model(voice)
                 
                 import time
                 timestamp = int(time.time())
                 voice_name = voice.split('/')[-1]
-                output_path = output_dir / f"voiceover_{voice_name}_{timestamp}.wav"
+                output_path = output_dir / f"voiceover_{voice_name}_{timestamp}_{uuid.uuid4().hex[:8]}.wav"
                 
-                tts.tts_to_file(text=script_text, file_path=str(output_path))
+                with _tts_lock:
+                    tts.tts_to_file(text=script_text, file_path=str(output_path))
                 
                 results[voice_name] = str(output_path)
                 print(f"Generated: {output_path}")
@@ -3,17 +3,79 @@ YouTube Tool - Download audio from YouTube videos using yt-dlp
 """
 
 import os
+import re
+import glob
+import shutil
 import yt_dlp
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 
-def get_audio_from_youtube(url: str) -> str:
+# Downloads are named "<title> [<video id>].mp3" so a repeat request for the
+# same video can be served from disk without touching the network
+_VIDEO_ID_RE = re.compile(r"(?:v=|youtu\.be/|shorts/|embed/)([\w-]{11})")
+MAX_CACHE_BYTES = int(os.getenv('YOUTUBE_CACHE_MAX_BYTES', str(10 * 1024 ** 3)))
+
+
+def extract_video_id(url: str) -> Optional[str]:
+    """
+    Extract the 11-character YouTube video ID from a URL
+    
+    Args:
+        url (str): YouTube video URL
+        
+    Returns:
+        str: The video ID, or None if the URL doesn't contain one
+    """
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+# Only the final post-processed MP3 counts as cached; yt-dlp/aria2c partial
+# files (.part, .ytdl, .aria2) and the pre-conversion download share its
+# name stem while a download is still running or after one crashed
+def _find_cached_audio(downloads_dir: Path, video_id: str) -> Optional[Path]:
+    for path in downloads_dir.glob(f"*{glob.escape(f' [{video_id}]')}.mp3"):
+        if path.is_file():
+            return path
+    return None
+
+
+def _evict_cached_audio(downloads_dir: Path, keep: Path) -> None:
+    # Least recently used first; cache hits refresh a file's mtime
+    cached = [p for p in downloads_dir.glob("* [[]*[]].mp3") if p.is_file()]
+    cached.sort(key=lambda p: p.stat().st_mtime)
+    total = sum(p.stat().st_size for p in cached)
+    for path in cached:
+        if total <= MAX_CACHE_BYTES:
+            break
+        if path == keep:
+            continue
+        total -= path.stat().st_size
+        path.unlink(missing_ok=True)
+        print(f"Evicted cached audio: {path}")
+
+
+def _make_progress_hook(progress_callback: Callable[[float], None]):
+    # yt-dlp reports bytes; total_bytes is missing for some formats, so fall
+    # back to its estimate
+    def hook(status: dict) -> None:
+        if status.get('status') == 'finished':
+            progress_callback(1.0)
+            return
+        total = status.get('total_bytes') or status.get('total_bytes_estimate')
+        if status.get('status') == 'downloading' and total:
+            progress_callback(status.get('downloaded_bytes', 0) / total)
+    return hook
+
+
+def get_audio_from_youtube(url: str, progress_callback: Optional[Callable[[float], None]] = None) -> str:
     """
     Download audio from a YouTube video URL using yt-dlp
     
     Args:
         url (str): YouTube video URL
+        progress_callback (Callable, optional): Called with the downloaded fraction (0.0-1.0)
         
     Returns:
         str: Path to the downloaded audio file
@@ -26,6 +88,15 @@ def get_audio_from_youtube(url: str) -> str:
         downloads_dir = Path("downloads")
         downloads_dir.mkdir(exist_ok=True)
         
+        # Serve repeat requests from disk before any network call
+        video_id = extract_video_id(url)
+        if video_id:
+            cached_path = _find_cached_audio(downloads_dir, video_id)
+            if cached_path:
+                cached_path.touch()
+                print(f"Using cached audio: {cached_path}")
+                return str(cached_path)
+        
         # Configure yt-dlp options for audio-only download
         ydl_opts = {
             'format': 'bestaudio/best',  # Best audio quality
@@ -35,8 +106,17 @@ def get_audio_from_youtube(url: str) -> str:
                 'preferredcodec': 'mp3',
             }],
             'noplaylist': True,  # Don't download playlists
+            'concurrent_fragment_downloads': 8,  # Fetch DASH/HLS fragments in parallel
         }
         
+        # aria2c opens several connections per file, which is much faster
+        # than yt-dlp's single-stream downloader on large audio files. yt-dlp
+        # doesn't run progress hooks for external downloaders, so keep the
+        # native one when the caller wants progress
+        if shutil.which('aria2c') and progress_callback is None:
+            ydl_opts['external_downloader'] = 'aria2c'
+            ydl_opts['external_downloader_args'] = ['-x', '16', '-s', '16', '-k', '1M']
+        
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
             # Extract video info first to get the filename
             info = ydl.extract_info(url, download=False)
@@ -46,19 +126,27 @@ def get_audio_from_youtube(url: str) -> str:
             safe_title = "".join(c for c in video_title if c.isalnum() or c in (' ', '-', '_')).rstrip()
             safe_title = safe_title[:100]  # Limit length
             
+            # Tag the file with the video ID so later calls can find it
+            video_id = video_id or info.get('id')
+            if video_id:
+                safe_title = f"{safe_title} [{video_id}]"
+            
             # Create new configuration with safe title
             download_opts = ydl_opts.copy()
             download_opts['outtmpl'] = str(downloads_dir / f'{safe_title}.%(ext)s')
+            if progress_callback:
+                download_opts['progress_hooks'] = [_make_progress_hook(progress_callback)]
             
             # Download the audio with new configuration
             with yt_dlp.YoutubeDL(download_opts) as ydl_download:
                 ydl_download.download([url])
             
             # Find the downloaded file
-            audio_files = list(downloads_dir.glob(f"{safe_title}.*"))
+            audio_files = list(downloads_dir.glob(f"{glob.escape(safe_title)}.mp3"))
             if audio_files:
                 audio_path = str(audio_files[0])
                 print(f"Successfully downloaded audio: {audio_path}")
+                _evict_cached_audio(downloads_dir, keep=audio_files[0])
                 return audio_path
             else:
                 raise Exception("Audio file not found after download")